@@ -1,7 +1,18 @@
 # File: GraphAlgs.jl
 
 from collections import deque
-from typing import Any, Deque, Dict, List, Literal, Optional, Protocol, Tuple, TypeVar
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 import networkx as nx
 
@@ -142,13 +153,23 @@ def reachable_from(g: "nx.Graph[T]", s: T, vlist: Optional[List[T]] = None) -> L
     Returns:
         The set of all vertices in `g` that are reachable from vertex `s`.
     """
-    if vlist is None:
-        vlist = []
-    for v in g.neighbors(s):
-        if v not in vlist:
-            vlist.append(v)
-        reachable_from(g, v, vlist)
-    return vlist
+    reachable: List[T] = [] if vlist is None else vlist
+    # vertices already in the list, which may not have had their descendants visited yet
+    found = set(reachable)
+    # vertices that have had everything reachable from them visited
+    visited: Set[T] = set()
+
+    def visit(u: T) -> None:
+        for v in g.neighbors(u):
+            if v not in found:
+                found.add(v)
+                reachable.append(v)
+            if v not in visited:
+                visited.add(v)
+                visit(v)
+
+    visit(s)
+    return reachable
 
 
 # The subgraph induced by vertex s and the vertices reachable from vertex s
@@ -311,25 +332,56 @@ def longest_paths(
     """
     Finds the set of longest paths in `g`.
 
-    For performance reasons, `longest_paths` doesn't check that `g` is acyclic, unlike the Julia version.
+    If `paths` isn't given, the length of the longest path ending at each vertex is found with a
+    single pass over `g` in topological order, and only paths that can be extended into a longest
+    path are enumerated, rather than enumerating every path in `g`. The paths are returned in the
+    same order as they would be found by :func:`all_paths`.
 
     Args:
         g: Acylic graph.
+        paths: All of the paths in `g`, as returned by :func:`all_paths`, if already known. An
+          empty list is treated as not given, so the paths are found from `g`.
 
     Returns:
         An array of vertex arrays, where each vertex
         array contains the vertices in a longest path.
+
+    Raises:
+        networkx.NetworkXUnfeasible: If `paths` isn't given and `g` contains a cycle.
     """
     lps: List[List[T]] = []
     max = 0
-    if not paths:
-        paths = all_paths(g)
-    for path in paths:  # find length of longest path
-        if len(path) > max:
-            max = len(path)
-    for path in paths:
-        if len(path) == max:
-            lps.append(path)
+    if paths:
+        for path in paths:  # find length of longest path
+            if len(path) > max:
+                max = len(path)
+        for path in paths:
+            if len(path) == max:
+                lps.append(path)
+        return lps
+    # number of vertices in the longest path from a source vertex to each vertex
+    depth: Dict[T, int] = {}
+    for v in nx.topological_sort(g):
+        depth[v] = 1
+        for u in g.predecessors(v):
+            if depth[u] + 1 > depth[v]:
+                depth[v] = depth[u] + 1
+        if depth[v] > max:
+            max = depth[v]
+    if max < 2:  # a path must contain at least two vertices
+        return lps
+    # work backwards from the sinks like all_paths, dropping paths that can't be a longest path
+    que: Deque[List[T]] = deque(
+        [v] for v in g.nodes if g.out_degree(v) == 0 and depth[v] == max
+    )
+    while que:
+        x = que.popleft()
+        for u in g.predecessors(x[0]):
+            if depth[u] + len(x) == max:
+                if g.in_degree(u) == 0:
+                    lps.append([u, *x])
+                else:
+                    que.append([u, *x])
     return lps
 
 
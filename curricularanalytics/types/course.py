@@ -9,13 +9,14 @@ A requirement may involve a set of courses (CourseSet), or a set of requirements
 """
 
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     Literal,
     Optional,
-    TextIO,
     Tuple,
     TypeVar,
 )
@@ -41,6 +42,21 @@ class AbstractCourse(ABC):
     * :class:`CourseCollection`: a set of courses, any of which can serve as the required course in a curriculum or degree plan.
     """
 
+    # curricula can have thousands of courses, so they don't need a __dict__ each
+    __slots__ = (
+        "id",
+        "vertex_id",
+        "name",
+        "credit_hours",
+        "institution",
+        "college",
+        "department",
+        "canonical_name",
+        "requisites",
+        "learning_outcomes",
+        "metadata",
+    )
+
     id: int
     "Unique course id"
     vertex_id: Dict[int, int]
@@ -138,37 +154,16 @@ class AbstractCourse(ABC):
         other: "AbstractCourse",
         match_criteria: List[MatchCriterion] = [],
     ) -> bool:
-        if len(match_criteria) == 0:
-            return self == other
-        for criterion in match_criteria:
-            if criterion == "prefix":
-                if isinstance(self, Course) and isinstance(other, Course):
-                    if self.prefix != other.prefix:
-                        return False
-            elif criterion == "num":
-                if isinstance(self, Course) and isinstance(other, Course):
-                    if self.num != other.num:
-                        return False
-            elif criterion == "name":
-                if self.name != other.name:
-                    return False
-            elif criterion == "canonical name":
-                if self.canonical_name != other.canonical_name:
-                    return False
-            elif criterion == "credit hours":
-                if self.credit_hours != other.credit_hours:
-                    return False
-            else:
-                raise ValueError(f"invalid match criteria: {criterion}")
-        return True
+        return match_predicate(match_criteria)(self, other)
 
     def find_match(
         self,
         course_set: List["AbstractCourse"],
         match_criteria: List[MatchCriterion] = [],
     ) -> Optional["AbstractCourse"]:
+        matches = match_predicate(match_criteria)
         for course in course_set:
-            if self.match(course, match_criteria):
+            if matches(self, course):
                 return self
         return None
 
@@ -193,6 +188,8 @@ class Course(AbstractCourse):
         Course(...)
     """
 
+    __slots__ = ("prefix", "num", "cross_listed", "passrate")
+
     prefix: str
     "Typcially a department prefix, e.g., PSY"
     num: str
@@ -255,6 +252,8 @@ class Course(AbstractCourse):
 
 
 class CourseCollection(AbstractCourse):
+    __slots__ = ("courses",)
+
     courses: List[Course]
     "Courses associated with the collection"
 
@@ -301,24 +300,71 @@ class CourseCollection(AbstractCourse):
         return f"Course(id={self.id}, vertex_id={self.vertex_id} courses={self.courses}, name={repr(self.name)}, credit_hours={self.credit_hours}, institution={self.institution}, college={repr(self.college)}, department={repr(self.department)}, canonical_name={repr(self.canonical_name)}, requisites={self.requisites}, learning_outcomes={self.learning_outcomes}, metadata={self.metadata})"
 
 
+def match_predicate(
+    match_criteria: List[MatchCriterion],
+) -> Callable[[AbstractCourse, AbstractCourse], bool]:
+    """
+    Build a function that determines whether two courses match according to ``match_criteria``
+    (see :meth:`AbstractCourse.match`), so the criteria only have to be parsed once when matching
+    many pairs of courses.
+
+    Raises:
+        ValueError: If a match criterion is not recognized.
+    """
+    if len(match_criteria) == 0:
+        return lambda course, other: course == other
+    # prefix and num are only compared if both courses are Courses
+    course_attributes: List[str] = []
+    attributes: List[str] = []
+    for criterion in match_criteria:
+        if criterion == "prefix" or criterion == "num":
+            course_attributes.append(criterion)
+        elif criterion == "name":
+            attributes.append("name")
+        elif criterion == "canonical name":
+            attributes.append("canonical_name")
+        elif criterion == "credit hours":
+            attributes.append("credit_hours")
+        else:
+            raise ValueError(f"invalid match criteria: {criterion}")
+    get_attributes = attrgetter(*attributes) if attributes else None
+    get_course_attributes = (
+        attrgetter(*course_attributes) if course_attributes else None
+    )
+
+    def matches(course: AbstractCourse, other: AbstractCourse) -> bool:
+        if get_attributes and get_attributes(course) != get_attributes(other):
+            return False
+        if (
+            get_course_attributes
+            and isinstance(course, Course)
+            and isinstance(other, Course)
+            and get_course_attributes(course) != get_course_attributes(other)
+        ):
+            return False
+        return True
+
+    return matches
+
+
 def course_id(name: str, prefix: str, num: str, institution: str) -> int:
     return hash(name + prefix + num + institution)
 
 
-def _write_course_name(file: TextIO, c: AbstractCourse) -> None:
+def _course_name(c: AbstractCourse) -> str:
     if isinstance(c, Course):
+        name = ""
         if c.prefix:
-            file.write(f"{c.prefix} ")
+            name += f"{c.prefix} "
         if c.num:
-            file.write(f"{c.num} - ")
-    file.write(c.name)
-
-
-def write_course_names(
-    file: TextIO, courses: List[AbstractCourse], *, separator: str = ", "
-) -> None:
-    if courses:
-        for c in courses[:-1]:
-            _write_course_name(file, c)
-            file.write(separator)
-        _write_course_name(file, courses[-1])
+            name += f"{c.num} - "
+        return name + c.name
+    return c.name
+
+
+def course_names(courses: List[AbstractCourse], *, separator: str = ", ") -> str:
+    """
+    Join the display names of ``courses``, i.e. ``{prefix} {num} - {name}`` for courses with a
+    prefix and number, with ``separator``.
+    """
+    return separator.join(_course_name(c) for c in courses)
@@ -15,31 +15,35 @@ import sys
 from collections import deque
 from functools import cached_property
 from io import StringIO
+from itertools import chain
 from typing import (
     Any,
-    Deque,
     Dict,
     FrozenSet,
     List,
     Literal,
     NamedTuple,
     Optional,
+    Sequence,
     Set,
     TextIO,
     Tuple,
+    TypeVar,
     Union,
     overload,
 )
+from weakref import WeakKeyDictionary
 
 import networkx as nx
 
-from ..graph_algs import all_paths, longest_paths, reachable_from
+from ..graph_algs import longest_paths
 from .course import (
     AbstractCourse,
     Course,
     MatchCriterion,
     course_id,
-    write_course_names,
+    course_names,
+    match_predicate,
 )
 from .data_types import (
     System,
@@ -55,6 +59,39 @@ from .data_types import (
 )
 from .learning_outcome import LearningOutcome
 
+N = TypeVar("N", int, float)
+
+# the most requisite cycles the constructor reports when ``warn`` is set, so that
+# warning about an invalid curriculum does not enumerate exponentially many cycles
+_WARN_MAX_CYCLES = 10
+
+# the report written by Curriculum.basic_metrics_to_buffer, which is followed by the
+# longest paths
+_BASIC_METRICS_REPORT = (
+    "\n{institution} "
+    "\nCurriculum: {name}\n"
+    "  credit hours = {credit_hours}\n"
+    "  number of courses = {num_courses}"
+    "\n  Blocking Factor --\n"
+    "    entire curriculum = {total_blocking_factor}\n"
+    "    max. value = {metrics.max_blocking_factor}, "
+    "for course(s): {blocking_factor_courses}"
+    "\n  Centrality --\n"
+    "    entire curriculum = {total_centrality}\n"
+    "    max. value = {metrics.max_centrality}, "
+    "for course(s): {centrality_courses}"
+    "\n  Delay Factor --\n"
+    "    entire curriculum = {total_delay_factor}\n"
+    "    max. value = {metrics.max_delay_factor}, "
+    "for course(s): {delay_factor_courses}"
+    "\n  Complexity --\n"
+    "    entire curriculum = {total_complexity}\n"
+    "    max. value = {metrics.max_complexity}, "
+    "for course(s): {complexity_courses}"
+    "\n  Longest Path(s) --\n"
+    "    length = {path_length}, number of paths = {num_paths}\n    path(s):\n"
+)
+
 
 class BasicMetrics(NamedTuple):
     """
@@ -87,7 +124,7 @@ class Curriculum:
     *degree program* synonymously.
 
     .. note::
-        The constructor for :class:`Curriculum` immediately creates a graph representing the course requisite relationships. Make sure all requisites have been added to the curriculum's courses before constructing :class:`Curriculum`. If anything about a curriculum's courses changes, create a new :class:`Curriculum` object to update the graph.
+        The constructor for :class:`Curriculum` immediately creates a graph representing the course requisite relationships. Make sure all requisites have been added to the curriculum's courses before constructing :class:`Curriculum`. If anything about a curriculum's courses changes, create a new :class:`Curriculum` object to update the graph. Metrics such as :meth:`similarity` are cached on first use, so don't modify :attr:`courses` after constructing the curriculum. The constructor copies the list of courses it is given, so that list can be reused.
 
     Args:
         name: The name of the curriculum.
@@ -128,13 +165,6 @@ class Curriculum:
     "Directed graph representation of pre-/co-requisite structure of the curriculum, note: this is a course graph"
     learning_outcomes: List[LearningOutcome]
     "A list of learning outcomes associated with the curriculum"
-    learning_outcome_graph: "nx.DiGraph[int]"
-    "Directed graph representatin of pre-/co-requisite structure of learning outcomes in the curriculum"
-    course_learning_outcome_graph: "nx.DiGraph[int]"
-    """
-    Directed Int64 metagraph with Float64 weights defined by weight (default weight 1.0)
-    This is a course and learning outcome graph
-    """
     metadata: Dict[str, Any]
     "Curriculum-related metadata"
 
@@ -158,19 +188,21 @@ class Curriculum:
         self.institution = institution
         self.id = id or hash(self.name + self.institution + str(self.degree_type))
         self.cip = cip
-        self.courses = sorted(courses, key=lambda c: c.id) if sort_by_id else courses
+        # always copy the course list, since the cached metrics assume it never changes
+        self.courses = (
+            sorted(courses, key=lambda c: c.id) if sort_by_id else list(courses)
+        )
         self.num_courses = len(self.courses)
         self.credit_hours = self.total_credits
         self.graph = self._create_graph()
         self.metadata = {}
-        self.learning_outcomes = learning_outcomes
-        self.learning_outcome_graph = self._create_learning_outcome_graph()
-        self.course_learning_outcome_graph = (
-            self._create_course_learning_outcome_graph()
+        self._similarities: "WeakKeyDictionary[Curriculum, Dict[bool, float]]" = (
+            WeakKeyDictionary()
         )
+        self.learning_outcomes = learning_outcomes
         if warn:
             errors = StringIO()
-            if not self.is_valid(errors):
+            if not self.is_valid(errors, max_cycles=_WARN_MAX_CYCLES):
                 # TODO: yellow text
                 print(
                     "WARNING: Curriculum was created, but is invalid due to requisite cycle(s):"
@@ -179,14 +211,22 @@ class Curriculum:
 
     def convert_ids(self) -> "Curriculum":
         "Converts course ids, from those used in CSV file format, to the standard hashed id used by the data structures in the toolbox"
+        # the courses that have each course ID as a requisite
+        requirers: Dict[int, List[AbstractCourse]] = {}
+        for other in self.courses:
+            for req_id in other.requisites:
+                requirers.setdefault(req_id, []).append(other)
         for course in self.courses:
             old_id = course.id
             course.id = course.default_id()
             if old_id != course.id:
-                for other in self.courses:
+                for other in requirers.get(old_id, []):
                     if old_id in other.requisites:
                         other.add_requisite(course, other.requisites[old_id])
                         del other.requisites[old_id]
+                        requirers.setdefault(course.id, []).append(other)
+        # the course IDs have changed, so the lookup table is out of date
+        self.__dict__.pop("_course_vertices", None)
         return self
 
     def course(
@@ -198,12 +238,12 @@ class Curriculum:
         Be advised that there may be multiple courses with the same ID in a curriculum, so this will return the first one in :attr:`courses`.
         """
         hash_val = course_id(name, prefix, num, institution)
-        try:
-            return next(course for course in self.courses if course.id == hash_val)
-        except StopIteration:
+        vertex = self._course_vertices.get(hash_val)
+        if vertex is None:
             raise LookupError(
                 f"Course: {prefix} {num}: {name} at {institution} does not exist in curriculum: {self.name}"
             )
+        return self.courses[vertex]
 
     def course_from_id(self, id: int) -> AbstractCourse:
         """
@@ -211,19 +251,21 @@ class Curriculum:
 
         Be advised that there may be multiple courses with the same ID in a curriculum, so this will return the first one in :attr:`courses`.
         """
-        for course in self.courses:
-            if course.id == id:
-                return course
-        raise KeyError(f"The course associated with id {id} is not in the curriculum.")
+        vertex = self._course_vertices.get(id)
+        if vertex is None:
+            raise KeyError(
+                f"The course associated with id {id} is not in the curriculum."
+            )
+        return self.courses[vertex]
 
     def lo_from_id(self, id: int) -> LearningOutcome:
         "Return the lo associated with a lo id in a curriculum"
-        for outcome in self.learning_outcomes:
-            if outcome.id == id:
-                return outcome
-        raise KeyError(f"The lo associated with id {id} is not in the curriculum.")
+        index = self._lo_indices.get(id)
+        if index is None:
+            raise KeyError(f"The lo associated with id {id} is not in the curriculum.")
+        return self.learning_outcomes[index]
 
-    @property
+    @cached_property
     def total_credits(self) -> float:
         "The total number of credit hours in a curriculum"
         return sum(course.credit_hours for course in self.courses)
@@ -233,22 +275,65 @@ class Curriculum:
         Return the vertex ID of the first course in the curriculum with the
         given course ID.
         """
-        for i, course in enumerate(self.courses):
-            if course.id == course_id:
-                return i
-        raise KeyError(f"The curriculum does not have a course with ID {course_id}.")
+        vertex = self._course_vertices.get(course_id)
+        if vertex is None:
+            raise KeyError(
+                f"The curriculum does not have a course with ID {course_id}."
+            )
+        return vertex
 
     def _lo_vertex(self, lo_id: int) -> int:
         """
         Return the vertex ID of the first learning outcome in the curriculum
         with the given ID.
         """
+        index = self._lo_indices.get(lo_id)
+        if index is None:
+            raise KeyError(
+                f"The curriculum does not have a learning outcome with ID {lo_id}."
+            )
+        return len(self.courses) + index
+
+    @cached_property
+    def _course_vertices(self) -> Dict[int, int]:
+        """
+        A map from course IDs to the vertex ID of the first course in the curriculum with
+        that ID. This must be cleared if the course IDs change.
+        """
+        vertices: Dict[int, int] = {}
+        for i, course in enumerate(self.courses):
+            vertices.setdefault(course.id, i)
+        return vertices
+
+    @cached_property
+    def _lo_indices(self) -> Dict[int, int]:
+        """
+        A map from learning outcome IDs to the index of the first learning outcome in the
+        curriculum with that ID.
+        """
+        indices: Dict[int, int] = {}
         for i, lo in enumerate(self.learning_outcomes):
-            if lo.id == lo_id:
-                return len(self.courses) + i
-        raise KeyError(
-            f"The curriculum does not have a learning outcome with ID {lo_id}."
-        )
+            indices.setdefault(lo.id, i)
+        return indices
+
+    @cached_property
+    def _course_set(self) -> Set[AbstractCourse]:
+        "The courses in the curriculum, for membership tests by identity."
+        return set(self.courses)
+
+    @cached_property
+    def _course_names(self) -> Set[str]:
+        "The names of the courses in the curriculum."
+        return {course.name for course in self.courses}
+
+    @cached_property
+    def _course_numbers(self) -> Set[Tuple[str, str]]:
+        "The prefix and number of each :class:`Course` in the curriculum."
+        return {
+            (course.prefix, course.num)
+            for course in self.courses
+            if isinstance(course, Course)
+        }
 
     def _create_graph(self) -> "nx.DiGraph[int]":
         """
@@ -258,63 +343,106 @@ class Curriculum:
         graph.add_nodes_from(range(len(self.courses)))
         for i, course in enumerate(self.courses):
             course.vertex_id[self.id] = i
-            for requisite in course.requisites.keys():
-                graph.add_edge(self._course_vertex(requisite), i)
+        graph.add_edges_from(
+            (self._course_vertex(requisite), i)
+            for i, course in enumerate(self.courses)
+            for requisite in course.requisites.keys()
+        )
         return graph
 
     @cached_property
-    def _all_paths(self) -> List[List[int]]:
-        return all_paths(self.graph)
+    def _sinks(self) -> List[int]:
+        """
+        The vertices at the end of a path in the curriculum graph, i.e. those with requisites but
+        that aren't a requisite for any course.
+        """
+        return [
+            v
+            for v in range(len(self.courses))
+            if not self._successors[v] and self._predecessors[v]
+        ]
 
-    def _create_course_learning_outcome_graph(self) -> "nx.DiGraph[int]":
+    @cached_property
+    def _predecessors(self) -> List[List[int]]:
         """
-        Create a curriculum directed graph from a curriculum specification. This graph contains courses and learning outcomes
-        of the curriculum.
+        The requisites of each vertex in the curriculum graph, as plain lists for the graph
+        algorithms that visit every edge, to avoid going through NetworkX's adjacency views.
+        """
+        return [list(self.graph.predecessors(v)) for v in range(len(self.courses))]
+
+    @cached_property
+    def _successors(self) -> List[List[int]]:
+        "The vertices that each vertex in the curriculum graph is a requisite for."
+        return [list(self.graph.successors(v)) for v in range(len(self.courses))]
+
+    @cached_property
+    def course_learning_outcome_graph(self) -> "nx.DiGraph[int]":
+        """
+        Directed Int64 metagraph with Float64 weights defined by weight (default weight 1.0)
+        This is a course and learning outcome graph
+
+        It is created from the curriculum specification the first time it is used.
         """
         graph: "nx.DiGraph[int]" = nx.DiGraph()
         graph.add_nodes_from(range(len(self.courses) + len(self.learning_outcomes)))
         # Add edges among courses
-        for i, course in enumerate(self.courses):
-            for req_id, req_type in course.requisites.items():
-                edge = self._course_vertex(req_id), i
-                graph.add_edge(*edge)
-                nx.set_edge_attributes(graph, {edge: {c_to_c: req_type}})
+        graph.add_edges_from(
+            (self._course_vertex(req_id), i, {c_to_c: req_type})
+            for i, course in enumerate(self.courses)
+            for req_id, req_type in course.requisites.items()
+        )
 
         # Add edges among learning_outcomes
-        for i, outcome in enumerate(self.learning_outcomes):
-            for requisite in outcome.requisites:
-                edge = self._lo_vertex(requisite), i
-                graph.add_edge(*edge)
-                nx.set_edge_attributes(graph, {edge: {lo_to_lo: pre}})
+        graph.add_edges_from(
+            (self._lo_vertex(requisite), i, {lo_to_lo: pre})
+            for i, outcome in enumerate(self.learning_outcomes)
+            for requisite in outcome.requisites
+        )
 
         # Add edges between each pair of a course and a learning outcome
-        for i, course in enumerate(self.courses):
-            for outcome in course.learning_outcomes:
-                edge = self._lo_vertex(outcome.id), i
-                graph.add_edge(*edge)
-                nx.set_edge_attributes(graph, {edge: {lo_to_c: belong_to}})
+        graph.add_edges_from(
+            (self._lo_vertex(outcome.id), i, {lo_to_c: belong_to})
+            for i, course in enumerate(self.courses)
+            for outcome in course.learning_outcomes
+        )
         return graph
 
-    def _create_learning_outcome_graph(self) -> "nx.DiGraph[int]":
+    @cached_property
+    def learning_outcome_graph(self) -> "nx.DiGraph[int]":
         """
-        Create a curriculum directed graph from a curriculum specification.
+        Directed graph representatin of pre-/co-requisite structure of learning outcomes in the curriculum
+
+        It is created from the curriculum specification the first time it is used.
         """
         graph: "nx.DiGraph[int]" = nx.DiGraph()
         graph.add_nodes_from(range(len(self.learning_outcomes)))
-        for i, outcome in enumerate(self.learning_outcomes):
-            for requisite in outcome.requisites.keys():
-                graph.add_edge(self._lo_vertex(requisite), i)
+        graph.add_edges_from(
+            (self._lo_vertex(requisite), i)
+            for i, outcome in enumerate(self.learning_outcomes)
+            for requisite in outcome.requisites.keys()
+        )
         return graph
 
     # Check if a curriculum graph has requisite cycles.
-    def is_valid(self, error_file: Optional[TextIO] = None) -> bool:
+    def is_valid(
+        self, error_file: Optional[TextIO] = None, *, max_cycles: Optional[int] = None
+    ) -> bool:
         """
         Tests whether or not the curriculum graph associated with the curriculum is valid, i.e.,
         whether or not it contains a requisite cycle, or requisites that cannot be satisfied.
 
+        Args:
+            error_file: A buffer to write the requisite cycles to if the curriculum is not valid.
+            max_cycles: The maximum number of distinct requisite cycles to write to
+              ``error_file``. By default, every cycle is written, which can take
+              exponential time.
+
         Returns:
             A boolean value, with ``True`` indicating the curriculum is valid, and ``False`` indicating it is not.
 
+        Raises:
+            ValueError: If ``max_cycles`` is negative.
+
         If the graph is not valid, messages are written to the ``error_file`` buffer. To view these errors, use::
 
             >>> errors = StringIO()
@@ -327,10 +455,10 @@ class Curriculum:
         is a strict corequisite for :math:`c_2`, as well as a requisite for :math:`c_1` (or a requisite for any course
         on a path leading to :math:`c_2`), then the set of requisites cannot be satisfied.
         """
+        if max_cycles is not None and max_cycles < 0:
+            raise ValueError("max_cycles cannot be negative")
         graph = self.graph.copy()
-        # First check for simple cycles
-        cycles = list(nx.simple_cycles(graph))
-        # Next check for cycles that could be created by strict co-requisites.
+        # Check for cycles that could be created by strict co-requisites.
         # For every strict-corequisite in the curriculum, add another strict-corequisite between the same two vertices, but in
         # the opposite direction. If this creates any cycles of length greater than 2 in the modified graph (i.e., involving
         # more than the two courses in the strict-corequisite relationship), then the curriculum is unsatisfiable.
@@ -341,23 +469,35 @@ class Curriculum:
                         i,  # destination vertex
                         self._course_vertex(req_course),  # source vertex
                     )
-        # remove length-2 cycles
-        new_cycles = (cycle for cycle in nx.simple_cycles(graph) if len(cycle) != 2)
-        # remove redundant cycles
-        cycles = set(tuple(cycle) for cycle in [*new_cycles, *cycles])
-        if len(cycles) != 0 and error_file:
-            if self.institution != "":
-                error_file.write(f"\n{self.institution}: ")
-            error_file.write(f" curriculum '{self.name}' has requisite cycles:\n")
-            for cycle in cycles:
-                error_file.write("(")
-                for i, vertex in enumerate(cycle):
-                    name: str = self.courses[vertex].name
-                    if i != len(cycle) - 1:
-                        error_file.write(f"{name}, ")
-                    else:
-                        error_file.write(f"{name})\n")
-        return len(cycles) == 0
+        # Determining whether there are any cycles takes linear time, so only enumerate
+        # the cycles, which can take exponential time, if they need to be reported
+        if self._topological_order is not None and not _has_long_cycle(graph):
+            return True
+        if not error_file:
+            return False
+        # simple cycles, and cycles other than length-2 cycles in the modified graph
+        all_cycles = chain(
+            (cycle for cycle in nx.simple_cycles(graph) if len(cycle) != 2),
+            nx.simple_cycles(self.graph),
+        )
+        # remove redundant cycles, rotating each cycle to start at its smallest vertex so a
+        # cycle found in both graphs is only reported once, and stop once enough distinct
+        # cycles have been found
+        cycles: Set[Tuple[int, ...]] = set()
+        if max_cycles != 0:
+            for cycle in all_cycles:
+                start = cycle.index(min(cycle))
+                cycles.add(tuple(cycle[start:] + cycle[:start]))
+                if len(cycles) == max_cycles:
+                    break
+        if self.institution != "":
+            error_file.write(f"\n{self.institution}: ")
+        error_file.write(f" curriculum '{self.name}' has requisite cycles:\n")
+        courses = self.courses
+        for cycle in cycles:
+            names = ", ".join(courses[vertex].name for vertex in cycle)
+            error_file.write(f"({names})\n")
+        return False
 
     def extraneous_requisites(self, *, debug: bool = False) -> Set[Tuple[int, int]]:
         r"""
@@ -366,52 +506,40 @@ class Curriculum:
         relationships :math:`c_1 \rightarrow c_2 \rightarrow c_3` and :math:`c_1 \rightarrow c_3`, and :math:`c_1` and :math:`c_2` are
         *not* co-requisites, then :math:`c_1 \rightarrow c_3` is redundant and therefore extraneous.
 
-        For performance reasons, `extraneous_requisites` doesn't check that the curriculum graph is acyclic, unlike the Julia version.
+        The curriculum graph must be acyclic.
         """
         redundant_reqs: Set[Tuple[int, int]] = set()
         extraneous = False
         string = ""  # create an empty string to hold messages
-        for component in nx.weakly_connected_components(self.graph):
-            # only consider components with more than one vertex
-            if len(component) <= 1:
+        # the vertices reachable from each vertex, shared with the blocking factors
+        reachable = self._reachable
+        successors = self._successors
+        for u, v in self.graph.edges:
+            # a requisite is redundant if there is another path between the two courses
+            if not any(
+                reachable[neighbor] >> v & 1
+                for neighbor in successors[u]
+                if neighbor != v
+            ):
+                # definitely not redundant requsisite
                 continue
-            for u in component:
-                u_neighbors = list(self.graph.neighbors(u))
-                queue: Deque[int] = deque()
-                for neighbor in u_neighbors:
-                    queue.append(neighbor)
-                while queue:
-                    x = queue.popleft()
-                    x_neighbors = self.graph.neighbors(x)
-                    for neighbor in x_neighbors:
-                        queue.append(neighbor)
-                    for v in self.graph.neighbors(x):
-                        if not self.graph.has_edge(u, v):
-                            # definitely not redundant requsisite
-                            continue
-                        # TODO: If this edge is a co-requisite it is an error, as it would be impossible to satsify.
-                        # This needs to be checked here.
-                        remove: bool = True
-                        # check for co- or strict_co requisites
-                        for neighbor in u_neighbors:
-                            # is there a path from n to v?
-                            if nx.has_path(self.graph, neighbor, v):
-                                # the requisite relationship between u and n
-                                req_type = self.courses[neighbor].requisites[
-                                    self.courses[u].id
-                                ]
-                                # is u a co or strict_co requisite for n?
-                                if req_type == co or req_type == strict_co:
-                                    remove = False  # a co or strict_co relationshipo is involved, must keep (u, v)
-                        if remove:
-                            # make sure redundant requisite wasn't previously found
-                            if (u, v) not in redundant_reqs:
-                                redundant_reqs.add(
-                                    (self.courses[u].id, self.courses[v].id)
-                                )
-                                if debug:
-                                    string += f"-{self.courses[v].name} has redundant requisite {self.courses[u].name}\n"
-                            extraneous = True
+            # TODO: If this edge is a co-requisite it is an error, as it would be impossible to satsify.
+            # This needs to be checked here.
+            remove: bool = True
+            # check for co- or strict_co requisites
+            for neighbor in successors[u]:
+                # is there a path from n to v?
+                if neighbor == v or reachable[neighbor] >> v & 1:
+                    # the requisite relationship between u and n
+                    req_type = self.courses[neighbor].requisites[self.courses[u].id]
+                    # is u a co or strict_co requisite for n?
+                    if req_type == co or req_type == strict_co:
+                        remove = False  # a co or strict_co relationshipo is involved, must keep (u, v)
+            if remove:
+                redundant_reqs.add((self.courses[u].id, self.courses[v].id))
+                if debug:
+                    string += f"-{self.courses[v].name} has redundant requisite {self.courses[u].name}\n"
+                extraneous = True
         if extraneous and debug:
             if self.institution:
                 sys.stdout.write(f"\n{self.institution}: ")
@@ -419,9 +547,46 @@ class Curriculum:
             sys.stdout.write(string)
         return redundant_reqs
 
+    @cached_property
+    def _topological_order(self) -> Optional[List[int]]:
+        """
+        The vertices of the curriculum graph in topological order, found using Kahn's algorithm,
+        or ``None`` if the graph has a cycle.
+        """
+        successors = self._successors
+        in_degrees = [len(requisites) for requisites in self._predecessors]
+        queue = deque(v for v, in_degree in enumerate(in_degrees) if in_degree == 0)
+        order: List[int] = []
+        while queue:
+            u = queue.popleft()
+            order.append(u)
+            for v in successors[u]:
+                in_degrees[v] -= 1
+                if in_degrees[v] == 0:
+                    queue.append(v)
+        # vertices on or after a cycle never reach an in-degree of 0
+        return order if len(order) == len(in_degrees) else None
+
+    @cached_property
+    def _graph_metrics(self) -> Tuple[List[int], List[int], List[int]]:
+        order = self._topological_order
+        if order is None:
+            raise ValueError(
+                f"Curriculum {self.name} has requisite cycles, so its metrics cannot be computed"
+            )
+        return _path_metrics(order, self._predecessors, self._successors)
+
+    @cached_property
+    def _reachable(self) -> List[int]:
+        """
+        The vertices reachable from each vertex in the curriculum graph, as bitsets where bit
+        ``w`` is set if there is a path to vertex ``w``.
+        """
+        return self._graph_metrics[0]
+
     @cached_property
     def _blocking_factors(self) -> List[int]:
-        return [len(reachable_from(self.graph, i)) for i in range(len(self.courses))]
+        return [bin(vertices).count("1") for vertices in self._reachable]
 
     # Compute the blocking factor of a course
     def blocking_factor(self, course: AbstractCourse) -> int:
@@ -456,12 +621,7 @@ class Curriculum:
 
     @cached_property
     def _delay_factors(self) -> List[int]:
-        delay_factors: List[int] = [1] * len(self.courses)
-        for path in self._all_paths:
-            for vertex in path:
-                # path_length in terms of # of vertices, not edges
-                delay_factors[vertex] = max(delay_factors[vertex], len(path))
-        return delay_factors
+        return self._graph_metrics[1]
 
     # Compute the delay factor of a course
     def delay_factor(self, course: AbstractCourse) -> int:
@@ -497,16 +657,7 @@ class Curriculum:
 
     @cached_property
     def _centralities(self) -> List[int]:
-        return [
-            sum(
-                len(path)
-                for path in self._all_paths
-                # conditions: path length is greater than 2, target course must be in the path, the target vertex
-                # cannot be the first or last vertex in the path
-                if (i in path and len(path) > 2 and path[0] != i and path[-1] != i)
-            )
-            for i in range(len(self.courses))
-        ]
+        return self._graph_metrics[2]
 
     # Compute the centrality of a course
     def centrality(self, course: AbstractCourse) -> int:
@@ -603,47 +754,45 @@ class Curriculum:
         Returns:
             A :class:`StringIO`. To print out the report, use ``print(report.getvalue())``.
         """
-        report = StringIO()
-        report.write(f"Comparing: C1 = {self.name} and C2 = {other.name}\n")
         metrics = {
             "blocking factor": (self._blocking_factors, other._blocking_factors),
             "delay factor": (self._delay_factors, other._delay_factors),
             "centrality": (self._centralities, other._centralities),
             "complexity": (self._complexities, other._complexities),
         }
+        # collect the report and write it to the IO buffer in one go
+        parts: List[str] = [f"Comparing: C1 = {self.name} and C2 = {other.name}\n"]
         for metric_name, (metric1, metric2) in metrics.items():
-            report.write(f" Curricular {metric_name}: ")
-            diff = sum(metric1) - sum(metric2)
+            total2 = sum(metric2)
+            diff = sum(metric1) - total2
             if diff > 0:
-                report.write(
-                    "C1 is %.1f units (%.0f%%) larger than C2\n"
-                    % (diff, 100 * diff / sum(metric2)),
+                summary = "C1 is %.1f units (%.0f%%) larger than C2\n" % (
+                    diff,
+                    100 * diff / total2,
                 )
             elif diff < 0:
-                report.write(
-                    "C1 is %.1f units (%.0f%%) smaller than C2\n"
-                    % (-diff, 100 * (-diff) / sum(metric2)),
+                summary = "C1 is %.1f units (%.0f%%) smaller than C2\n" % (
+                    -diff,
+                    100 * (-diff) / total2,
                 )
             else:
-                report.write(f"C1 and C2 have the same curricular {metric_name}\n")
-
-            report.write(f"  Course-level {metric_name}:\n")
-            maxval = max(metric1)
-            report.write(
-                f"   Largest {metric_name} value in C1 is {maxval} for course: "
-            )
-            for i, metric in enumerate(metric1):
-                if metric == maxval:
-                    report.write(f"{self.courses[i].name}  ")
-            report.write("\n")
-            maxval = max(metric2)
-            report.write(
-                f"   Largest {metric_name} value in C2 is {maxval} for course: "
+                summary = f"C1 and C2 have the same curricular {metric_name}\n"
+            max1, vertices1 = _max_with_ties(metric1)
+            max2, vertices2 = _max_with_ties(metric2)
+            parts.extend(
+                [
+                    f" Curricular {metric_name}: {summary}",
+                    f"  Course-level {metric_name}:\n",
+                    f"   Largest {metric_name} value in C1 is {max1} for course: ",
+                    *(f"{self.courses[i].name}  " for i in vertices1),
+                    "\n",
+                    f"   Largest {metric_name} value in C2 is {max2} for course: ",
+                    *(f"{other.courses[i].name}  " for i in vertices2),
+                    "\n",
+                ]
             )
-            for i, metric in enumerate(metric2):
-                if metric == maxval:
-                    report.write(f"{other.courses[i].name}  ")
-            report.write("\n")
+        report = StringIO()
+        report.write("".join(parts))
         return report
 
     @overload
@@ -674,14 +823,16 @@ class Curriculum:
         """
         if type == "object":
             return [self.course_from_id(id) for id in ids]
-        else:
+        id_set = set(ids)
+        if type == "fullname":
             return [
                 f"{course.prefix} {course.num} - {course.name}"
-                if type == "fullname" and isinstance(course, Course)
+                if isinstance(course, Course)
                 else course.name
                 for course in self.courses
-                if course.id in ids
+                if course.id in id_set
             ]
+        return [course.name for course in self.courses if course.id in id_set]
 
     # Basic metrics for a currciulum.
     @cached_property
@@ -698,36 +849,49 @@ class Curriculum:
 
         Complete descriptions of these metrics are provided above.
         """
-        # compute all curricular metrics
-        max_blocking_factor: int = max(self._blocking_factors)
-        max_delay_factor: int = max(self._delay_factors)
-        max_centrality: int = max(self._centralities)
-        max_complexity: float = max(self._complexities)
+        # find the maximum of every curricular metric, and the courses with it, in one pass
+        courses = self.courses
+        max_bf = self._blocking_factors[0]
+        max_df = self._delay_factors[0]
+        max_cent = self._centralities[0]
+        max_cc = self._complexities[0]
+        bf_courses: List[AbstractCourse] = []
+        df_courses: List[AbstractCourse] = []
+        cent_courses: List[AbstractCourse] = []
+        cc_courses: List[AbstractCourse] = []
+        for i, (bf, df, cent, cc) in enumerate(
+            zip(
+                self._blocking_factors,
+                self._delay_factors,
+                self._centralities,
+                self._complexities,
+            )
+        ):
+            if bf > max_bf:
+                max_bf, bf_courses = bf, [courses[i]]
+            elif bf == max_bf:
+                bf_courses.append(courses[i])
+            if df > max_df:
+                max_df, df_courses = df, [courses[i]]
+            elif df == max_df:
+                df_courses.append(courses[i])
+            if cent > max_cent:
+                max_cent, cent_courses = cent, [courses[i]]
+            elif cent == max_cent:
+                cent_courses.append(courses[i])
+            if cc > max_cc:
+                max_cc, cc_courses = cc, [courses[i]]
+            elif cc == max_cc:
+                cc_courses.append(courses[i])
         return BasicMetrics(
-            max_blocking_factor,
-            [
-                course
-                for i, course in enumerate(self.courses)
-                if self._blocking_factors[i] == max_blocking_factor
-            ],
-            max_delay_factor,
-            [
-                course
-                for i, course in enumerate(self.courses)
-                if self._delay_factors[i] == max_delay_factor
-            ],
-            max_centrality,
-            [
-                course
-                for i, course in enumerate(self.courses)
-                if self._centralities[i] == max_centrality
-            ],
-            max_complexity,
-            [
-                course
-                for i, course in enumerate(self.courses)
-                if self._complexities[i] == max_complexity
-            ],
+            max_bf,
+            bf_courses,
+            max_df,
+            df_courses,
+            max_cent,
+            cent_courses,
+            max_cc,
+            cc_courses,
         )
 
     def basic_metrics_to_buffer(self) -> StringIO:
@@ -749,40 +913,33 @@ class Curriculum:
             >>> metrics = curriculum.basic_metrics_to_buffer()
             >>> print(metrics.getvalue())
         """
+        metrics = self.basic_metrics
+        paths = self.longest_paths
+        report = _BASIC_METRICS_REPORT.format(
+            institution=self.institution,
+            name=self.name,
+            credit_hours=self.credit_hours,
+            num_courses=self.num_courses,
+            total_blocking_factor=self.total_blocking_factor,
+            total_centrality=self.total_centrality,
+            total_delay_factor=self.total_delay_factor,
+            total_complexity=self.total_complexity,
+            metrics=metrics,
+            blocking_factor_courses=course_names(metrics.max_blocking_factor_courses),
+            centrality_courses=course_names(metrics.max_centrality_courses),
+            delay_factor_courses=course_names(metrics.max_delay_factor_courses),
+            complexity_courses=course_names(metrics.max_complexity_courses),
+            path_length=len(paths[0]),
+            num_paths=len(paths),
+        )
         buffer = StringIO()
-        # write metrics to IO buffer
-        buffer.write(f"\n{self.institution} ")
-        buffer.write(f"\nCurriculum: {self.name}\n")
-        buffer.write(f"  credit hours = {self.credit_hours}\n")
-        buffer.write(f"  number of courses = {self.num_courses}")
-        buffer.write("\n  Blocking Factor --\n")
-        buffer.write(f"    entire curriculum = {self.total_blocking_factor}\n")
-        buffer.write(f"    max. value = {self.basic_metrics.max_blocking_factor}, ")
-        buffer.write("for course(s): ")
-        write_course_names(buffer, self.basic_metrics.max_blocking_factor_courses)
-        buffer.write("\n  Centrality --\n")
-        buffer.write(f"    entire curriculum = {self.total_centrality}\n")
-        buffer.write(f"    max. value = {self.basic_metrics.max_centrality}, ")
-        buffer.write("for course(s): ")
-        write_course_names(buffer, self.basic_metrics.max_centrality_courses)
-        buffer.write("\n  Delay Factor --\n")
-        buffer.write(f"    entire curriculum = {self.total_delay_factor}\n")
-        buffer.write(f"    max. value = {self.basic_metrics.max_delay_factor}, ")
-        buffer.write("for course(s): ")
-        write_course_names(buffer, self.basic_metrics.max_delay_factor_courses)
-        buffer.write("\n  Complexity --\n")
-        buffer.write(f"    entire curriculum = {self.total_complexity}\n")
-        buffer.write(f"    max. value = {self.basic_metrics.max_complexity}, ")
-        buffer.write("for course(s): ")
-        write_course_names(buffer, self.basic_metrics.max_complexity_courses)
-        buffer.write("\n  Longest Path(s) --\n")
         buffer.write(
-            f"    length = {len(self.longest_paths[0])}, number of paths = {len(self.longest_paths)}\n    path(s):\n",
+            report
+            + "".join(
+                f"    path {i} = {course_names(path, separator=' -> ')}\n"
+                for i, path in enumerate(paths, 1)
+            )
         )
-        for i, path in enumerate(self.longest_paths, 1):
-            buffer.write(f"    path {i} = ")
-            write_course_names(buffer, path, separator=" -> ")
-            buffer.write("\n")
         return buffer
 
     def similarity(self, basis: "Curriculum", *, strict: bool = True) -> float:
@@ -801,29 +958,36 @@ class Curriculum:
             raise ValueError(
                 f"Curriculum {basis.name} does not have any courses, similarity cannot be computed"
             )
-        if self == basis:
-            return 1
+        # Curriculum doesn't define structural equality, so an identity check is all
+        # that is needed to detect comparing a curriculum against itself
+        if self is basis:
+            return 1.0
+        # curricula can't be modified after construction, so the result for a given
+        # basis can be reused, e.g. by repeated homology() calls
+        similarities = self._similarities.setdefault(basis, {})
+        if strict in similarities:
+            return similarities[strict]
         matches = 0
-        for course in self.courses:
-            if strict:
-                if course in basis.courses:
+        if strict:
+            # courses don't define equality, so this matches the same course objects
+            basis_courses = basis._course_set
+            for course in self.courses:
+                if course in basis_courses:
                     matches += 1
-            else:
-                for basis_course in basis.courses:
-                    if (
-                        (course.name != "" and basis_course.name == course.name)
-                        or isinstance(course, Course)
-                        and isinstance(basis_course, Course)
-                        and (
-                            course.prefix != ""
-                            and basis_course.prefix == course.prefix
-                            and course.num != ""
-                            and basis_course.num == course.num
-                        )
-                    ):
-                        matches += 1
-                        break  # only match once
-        return matches / basis.num_courses
+        else:
+            # the basis indexes are cached, so each course is matched with a hash lookup
+            basis_names = basis._course_names
+            basis_numbers = basis._course_numbers
+            for course in self.courses:
+                if (course.name != "" and course.name in basis_names) or (
+                    isinstance(course, Course)
+                    and course.prefix != ""
+                    and course.num != ""
+                    and (course.prefix, course.num) in basis_numbers
+                ):
+                    matches += 1
+        similarities[strict] = matches / basis.num_courses
+        return similarities[strict]
 
     def merge(
         self,
@@ -859,13 +1023,16 @@ class Curriculum:
         """
         merged_courses = self.courses.copy()
         extra_courses: List[AbstractCourse] = []
+        # map course IDs in other to their courses once, rather than scanning
+        # other.courses for every requisite; iterate in reverse so the first course
+        # with a given ID wins, matching course_from_id
+        other_courses = {course.id: course for course in reversed(other.courses)}
+        matches = match_predicate(match_criteria)
+        # the index of each course in other that doesn't match a course in self
+        extra_indices: Dict[AbstractCourse, int] = {}
         for course in other.courses:
-            matched = False
-            for target_course in self.courses:
-                if course.match(target_course, match_criteria) == True:
-                    matched = True
-                #    skip TODO
-            if not matched:
+            if not any(matches(course, target) for target in self.courses):
+                extra_indices.setdefault(course, len(extra_courses))
                 extra_courses.append(course)
         # patch-up requisites of extra_courses, using course ids form c1 where appropriate
         # for each extra course create an indentical coures, but with a new course id
@@ -875,20 +1042,20 @@ class Curriculum:
             #    print(f"total requisistes = {len(c.requisites)},")
             for req in course.requisites.keys():
                 #        print(f" requisite id: {req} ")
-                req_course = other.course_from_id(req)
-                if req_course.find_match(merged_courses, match_criteria) != None:
+                req_course = other_courses[req]
+                # every course in other was already matched against the courses in self,
+                # so there's no need to search merged_courses or extra_courses again
+                if req_course not in extra_indices:
                     # requisite already exists in c1
                     #            print(f" match in c1 - {course_from_id(c1, req).name} ")
                     new_course.add_requisite(req_course, course.requisites[req])
-                elif req_course.find_match(extra_courses, match_criteria) != None:
+                else:
                     # requisite is not in c1, but it's in c2 -- use the id of the new course created for it
                     #            print(" match in extra courses, ")
-                    i = extra_courses.index(req_course)
+                    i = extra_indices[req_course]
                     #            print(f" index of match = {i} ")
                     new_course.add_requisite(new_courses[i], course.requisites[req])
-                else:  # requisite is neither in c1 or 2 -- this shouldn't happen => error
-                    raise Exception(f"requisite error on course: {course.name}")
-        merged_courses = [*merged_courses, *new_courses]
+        merged_courses.extend(new_courses)
         merged_curric = Curriculum(
             name,
             merged_courses,
@@ -921,47 +1088,152 @@ class Curriculum:
             >>> curric.dead_ends(frozenset({"BIO"}))
         """
         dead_end_courses: List[Course] = []
-        paths = self._all_paths
-        for path in paths:
-            course = self.courses[path[-1]]
+        seen: Set[Course] = set()
+        for vertex in self._sinks:
+            course = self.courses[vertex]
             if not isinstance(course, Course) or course.prefix == "":
                 continue
-            if course.prefix not in prefixes:
-                if course not in dead_end_courses:
-                    dead_end_courses.append(course)
+            if course.prefix not in prefixes and course not in seen:
+                seen.add(course)
+                dead_end_courses.append(course)
         return prefixes, dead_end_courses
 
-    def __repr__(self) -> str:
+    def describe(self) -> str:
+        """
+        Return a detailed representation of the curriculum, including all of its courses and
+        graphs. Unlike :func:`repr`, this is proportional in size to the curriculum.
+        """
         return f"Curriculum(id={self.id}, name={repr(self.name)}, institution={repr(self.institution)}, degree_type={repr(self.degree_type)}, system_type={self.system_type} cip={repr(self.cip)}, courses={self.courses}, num_courses={self.num_courses}, credit_hours={self.credit_hours}, graph={self.graph}, learning_outcomes={self.learning_outcomes}, learning_outcome_graph={self.learning_outcome_graph}, course_learning_outcome_graph={self.course_learning_outcome_graph}, metadata={self.metadata})"
 
+    def __repr__(self) -> str:
+        return f"Curriculum(id={self.id}, name={repr(self.name)}, institution={repr(self.institution)}, num_courses={self.num_courses}, credit_hours={self.credit_hours})"
+
+
+def _path_metrics(
+    order: List[int], predecessors: List[List[int]], successors: List[List[int]]
+) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Compute the vertices reachable from each vertex, as bitsets, and the delay factor and
+    centrality of every vertex in an acyclic graph with one pass over the graph in
+    topological order and one pass in reverse, rather than by enumerating every path in
+    the graph.
+
+    Args:
+        order: The vertices of the graph, ``0`` to ``n - 1``, in topological order.
+        predecessors: The in-neighbors of each vertex.
+        successors: The out-neighbors of each vertex.
+    """
+    n = len(order)
+    # for the paths from a source vertex to each vertex: the number of vertices in the
+    # longest path, the number of paths, and the total number of vertices in the paths
+    longest_to = [1] * n
+    paths_to = [0] * n
+    lengths_to = [0] * n
+    for v in order:
+        if not predecessors[v]:
+            paths_to[v] = 1
+            lengths_to[v] = 1
+        for u in predecessors[v]:
+            longest_to[v] = max(longest_to[v], longest_to[u] + 1)
+            paths_to[v] += paths_to[u]
+            lengths_to[v] += lengths_to[u] + paths_to[u]
+    # likewise for the paths from each vertex to a sink vertex, along with the set of
+    # vertices reachable from each vertex as a bitset, where bit w is set if w is reachable
+    longest_from = [1] * n
+    paths_from = [0] * n
+    lengths_from = [0] * n
+    reachable = [0] * n
+    for v in reversed(order):
+        if not successors[v]:
+            paths_from[v] = 1
+            lengths_from[v] = 1
+        for w in successors[v]:
+            longest_from[v] = max(longest_from[v], longest_from[w] + 1)
+            paths_from[v] += paths_from[w]
+            lengths_from[v] += lengths_from[w] + paths_from[w]
+            reachable[v] |= 1 << w | reachable[w]
+    # the vertex is counted in both halves of the path
+    delay_factors = [to + from_ - 1 for to, from_ in zip(longest_to, longest_from)]
+    # a path through v is a path from a source to v joined with a path from v to a sink,
+    # so each of the paths_to[v] paths to v appears paths_from[v] times, and vice versa
+    centralities = [
+        lengths_to[v] * paths_from[v]
+        + paths_to[v] * lengths_from[v]
+        - paths_to[v] * paths_from[v]
+        # sources and sinks can't be in the middle of a path
+        if predecessors[v] and successors[v]
+        else 0
+        for v in range(n)
+    ]
+    return reachable, delay_factors, centralities
+
+
+def _has_long_cycle(g: "nx.DiGraph[int]") -> bool:
+    """
+    Determine whether ``g`` has a cycle other than a length-2 cycle, i.e. a pair of vertices with
+    edges in both directions, in linear time.
+    """
+    for component in nx.strongly_connected_components(g):
+        if len(component) == 1:
+            (v,) = component
+            if g.has_edge(v, v):
+                return True
+            continue
+        # If an edge within the component has no reverse edge, the shortest path back
+        # closes a cycle of length 3 or more. Otherwise, the component is an undirected
+        # graph, which has a cycle if it has at least as many edges as vertices.
+        pairs = 0
+        for u in component:
+            for v in g.successors(u):
+                if v not in component:
+                    continue
+                if u == v or not g.has_edge(v, u):
+                    return True
+                pairs += 1
+        if pairs // 2 >= len(component):
+            return True
+    return False
+
+
+def _max_with_ties(values: Sequence[N]) -> Tuple[N, List[int]]:
+    """
+    Find the largest value in ``values`` along with the indices of every value equal to it, in a
+    single pass.
+    """
+    max_value = values[0]
+    indices: List[int] = []
+    for i, value in enumerate(values):
+        if value > max_value:
+            max_value = value
+            indices = [i]
+        elif value == max_value:
+            indices.append(i)
+    return max_value, indices
+
 
 def basic_statistics(metric_name: str, metrics: List[float]) -> StringIO:
     buffer = StringIO()
-    # set initial values used to find min and max metric values
-    total_metric = 0
-    STD_metric = 0
-    max_metric = -math.inf
-    min_metric = math.inf
-    max_metric = metrics[0]
-    min_metric = metrics[0]
     # metric where total curricular metric as well as course-level metrics are stored in an array
-    for value in metrics:
-        # metric where total curricular metric as well as course-level metrics are stored in an array
-        total_metric += value
-        if value > max_metric:
-            max_metric = value
-        if value < min_metric:
-            min_metric = value
+    total_metric = sum(metrics)
+    max_metric = max(metrics)
+    min_metric = min(metrics)
     avg_metric = total_metric / len(metrics)
+    STD_metric = 0
     for value in metrics:
         STD_metric = (value - avg_metric) ** 2
     STD_metric = math.sqrt(STD_metric / len(metrics))
-    buffer.write(f"\n Metric -- {metric_name}")
-    buffer.write(f"\n  Number of curricula = {len(metrics)}")
-    buffer.write(f"\n  Mean = {avg_metric}")
-    buffer.write(f"\n  STD = {STD_metric}")
-    buffer.write(f"\n  Max. = {max_metric}")
-    buffer.write(f"\n  Min. = {min_metric}")
+    buffer.write(
+        "".join(
+            [
+                f"\n Metric -- {metric_name}",
+                f"\n  Number of curricula = {len(metrics)}",
+                f"\n  Mean = {avg_metric}",
+                f"\n  STD = {STD_metric}",
+                f"\n  Max. = {max_metric}",
+                f"\n  Min. = {min_metric}",
+            ]
+        )
+    )
     return buffer
 
 
@@ -5,9 +5,9 @@ Term data type
 import math
 from functools import cached_property
 from io import StringIO
-from typing import Any, Dict, List, NamedTuple, Optional, Set
+from itertools import accumulate
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
-from ..graph_algs import edge_crossings
 from .course import AbstractCourse
 from .curriculum import Curriculum
 from .data_types import pre
@@ -96,14 +96,16 @@ class DegreePlan:
         name: str,
         curriculum: Curriculum,
         terms: List[Term],
-        additional_courses: List[AbstractCourse] = [],
+        additional_courses: Optional[List[AbstractCourse]] = None,
     ) -> None:
         self.name = name
         self.curriculum = curriculum
         self.num_terms = len(terms)
         self.terms = terms.copy()
         self.credit_hours = sum(term.credit_hours for term in terms)
-        self.additional_courses = additional_courses.copy()
+        self.additional_courses = (
+            [] if additional_courses is None else additional_courses.copy()
+        )
         self.metadata = {}
 
     # Check if a degree plan is valid.
@@ -131,22 +133,33 @@ class DegreePlan:
         - Incomplete plan: There are course in the curriculum not included in the degree plan.
         - Redundant plan: The same course appears in the degree plan multiple times.
         """
-        validity: bool = True
+        # the errors are collected and written to the buffer all at once
+        messages: List[str] = []
         # All requisite relationships are satisfied?
         #  -no backwards pointing requisites
+        # map each requisite ID to the courses in the plan that require it, in plan
+        # order, so each course only has to look at the courses that depend on it.
+        # The same pass collects the courses in the plan and any repeated courses.
+        dependents: Dict[int, List[Tuple[int, AbstractCourse]]] = {}
+        dp_classes: Set[int] = set()
+        duplicates: List[AbstractCourse] = []
+        for j, term in enumerate(self.terms):
+            for course in term.courses:
+                if course.id in dp_classes:
+                    duplicates.append(course)
+                dp_classes.add(course.id)
+                for req in course.requisites:
+                    dependents.setdefault(req, []).append((j, course))
         for i, term1 in enumerate(self.terms):
             for course1 in term1.courses:
-                for j, term2 in enumerate(self.terms[0:i]):
-                    for course2 in term2.courses:
-                        for l in course2.requisites:
-                            if l == course1.id:
-                                if errors:
-                                    validity = False
-                                    errors.write(
-                                        f"\n-Invalid requisite: {course1.name} in term {i + 1} is a requisite for {course2.name} in term {j + 1}",
-                                    )
-                                else:
-                                    return False
+                for j, course2 in dependents.get(course1.id, []):
+                    if j < i:
+                        if errors:
+                            messages.append(
+                                f"\n-Invalid requisite: {course1.name} in term {i + 1} is a requisite for {course2.name} in term {j + 1}",
+                            )
+                        else:
+                            return False
         #  -requisites within the same term must be corequisites
         for i, term in enumerate(self.terms):
             for course in term.courses:
@@ -155,45 +168,35 @@ class DegreePlan:
                         continue
                     if r.id in course.requisites and course.requisites[r.id] == pre:
                         if errors:
-                            validity = False
-                            errors.write(
+                            messages.append(
                                 f"\n-Invalid prerequisite: {r.name} in term {i + 1} is a prerequisite for {course.name} in the same term",
                             )
                         else:
                             return False
         #  -TODO: strict co-requisites must be in the same term
         # All courses in the curriculum are in the degree plan?
-        curric_classes: Set[int] = set()
-        dp_classes: Set[int] = set()
-        for course in self.curriculum.courses:
-            curric_classes.add(course.id)
-        for term in self.terms:
-            for course1 in term.courses:
-                dp_classes.add(course1.id)
-        if curric_classes - dp_classes:
+        curric_classes = {course.id for course in self.curriculum.courses}
+        missing = curric_classes - dp_classes
+        if missing:
             if errors:
-                validity = False
-                for i in curric_classes - dp_classes:
+                for i in missing:
                     course: AbstractCourse = self.curriculum.course_from_id(i)
-                    errors.write(
+                    messages.append(
                         f"\n-Degree self is missing required course: {course.name}"
                     )
             else:
                 return False
         # Is a course in the degree plan multiple times?
-        dp_classes: Set[int] = set()
-        for term in self.terms:
-            for course in term.courses:
-                if course.id in dp_classes:
-                    if errors:
-                        validity = False
-                        errors.write(
-                            f"\n-Course {course.name} is listed multiple times in degree plan",
-                        )
-                    else:
-                        return False
-                dp_classes.add(course.id)
-        return validity
+        for course in duplicates:
+            if errors:
+                messages.append(
+                    f"\n-Course {course.name} is listed multiple times in degree plan",
+                )
+            else:
+                return False
+        if errors:
+            errors.write("".join(messages))
+        return not messages
 
     def knowledge_transfer(self) -> List[float]:
         """
@@ -204,26 +207,40 @@ class DegreePlan:
             between the courses in the first two terms in the degree plan, and the remainder of the degree plan, etc.
             The length of the list returned will be one less than the number of terms in the degree plan.
         """
-        ec_terms: List[float] = []
-        s: List[int] = []
-        for term in self.terms:
-            sum = 0
-            for c in term.courses:
-                s.append(c.id)
-            sum += edge_crossings(self.curriculum.graph, s)
-            ec_terms.append(sum)
-        del ec_terms[-1]
-        return ec_terms  # the last value will always be zero, so remove it
+        # the term each vertex in the curriculum graph is in; courses missing from the
+        # plan are treated as coming after the last term
+        vertex_terms = [
+            self._course_terms.get(course, self.num_terms)
+            for course in self.curriculum.courses
+        ]
+        # a requisite crosses every cut from the term of the requisite up to, but not
+        # including, the term of the course requiring it, so count the crossings with
+        # a difference array instead of checking every cut for every requisite
+        changes = [0] * (self.num_terms + 1)
+        for u, v in self.curriculum.graph.edges:
+            if vertex_terms[u] < vertex_terms[v]:
+                changes[vertex_terms[u]] += 1
+                changes[vertex_terms[v]] -= 1
+        return list(accumulate(changes[: self.num_terms - 1]))
 
     def find_term(self, course: AbstractCourse) -> int:
         """
         In degree plan `plan`, find the term in which course `course` appears.  If `course` in not in the degree plan an
         error message is provided.
         """
+        term = self._course_terms.get(course)
+        if term is None:
+            raise ValueError(f"Course {course.name} is not in the degree plan")
+        return term
+
+    @cached_property
+    def _course_terms(self) -> Dict[AbstractCourse, int]:
+        "A map from each course in the degree plan to the first term it appears in."
+        terms: Dict[AbstractCourse, int] = {}
         for i, term in enumerate(self.terms):
-            if course in term.courses:
-                return i
-        raise ValueError(f"Course {course.name} is not in the degree plan")
+            for course in term.courses:
+                terms.setdefault(course, i)
+        return terms
 
     # ugly print of degree plan
     def print(self) -> None:
@@ -260,20 +277,14 @@ class DegreePlan:
         .. math::
             \sigma = \sqrt{\sum_{i=1}^m {(ch_i - \overline{ch})^2 \over m}}
         """
-        min_credits: float = self.credit_hours
-        max_credits: float = 0
-        min_term: int = 0
-        max_term: int = 0
-        variance: float = 0
+        credits = [term.credit_hours for term in self.terms]
         average = self.credit_hours / self.num_terms
-        for i, term in enumerate(self.terms):
-            if term.credit_hours > max_credits:
-                max_credits = term.credit_hours
-                max_term = i
-            if term.credit_hours < min_credits:
-                min_credits = term.credit_hours
-                min_term = i
-            variance = variance + (term.credit_hours - average) ** 2
+        # list.index finds the earliest term with the extreme value
+        min_credits = min(credits)
+        min_term = credits.index(min_credits)
+        max_credits = max(credits)
+        max_term = credits.index(max_credits)
+        variance = sum((term_credits - average) ** 2 for term_credits in credits)
         return TermMetrics(
             min=min_credits,
             min_term=min_term,
@@ -319,17 +330,11 @@ class DegreePlan:
         buffer = StringIO()
         buffer.write(
             f"\nCurriculum: {self.curriculum.name}\nDegree Plan: {self.name}\n"
-        )
-        buffer.write(f"  total credit hours = {self.credit_hours}\n")
-        buffer.write(f"  number of terms = {self.num_terms}\n")
-        buffer.write(
+            f"  total credit hours = {self.credit_hours}\n"
+            f"  number of terms = {self.num_terms}\n"
             f"  max. credits in a term = {max_credits}, in term {max_term+1}\n"
-        )
-        buffer.write(
             f"  min. credits in a term = {min_credits}, in term {min_term+1}\n"
-        )
-        buffer.write(
-            f"  avg. credits per term = {average}, with std. dev. = {stddev}\n",
+            f"  avg. credits per term = {average}, with std. dev. = {stddev}\n"
         )
         return buffer
 
@@ -2,8 +2,17 @@ import unittest
 from contextlib import redirect_stdout
 from io import StringIO
 from pathlib import Path
+from typing import List
 
-from curricularanalytics import Course, Curriculum, co, pre, read_csv, strict_co
+from curricularanalytics import (
+    AbstractCourse,
+    Course,
+    Curriculum,
+    co,
+    pre,
+    read_csv,
+    strict_co,
+)
 
 
 class CurricularAnalyticsTests(unittest.TestCase):
@@ -49,6 +58,62 @@ class CurricularAnalyticsTests(unittest.TestCase):
         curric = Curriculum("Unsatisfiable", [a, b, c], sort_by_id=False)
         errors = StringIO()
         self.assertFalse(curric.is_valid(errors))
+        self.assertEqual(
+            errors.getvalue(),
+            " curriculum 'Unsatisfiable' has requisite cycles:\n(A, B, C)\n",
+        )
+        self.assertFalse(curric.is_valid())
+        errors = StringIO()
+        self.assertFalse(curric.is_valid(errors, max_cycles=0))
+        self.assertEqual(
+            errors.getvalue(), " curriculum 'Unsatisfiable' has requisite cycles:\n"
+        )
+
+    def test_max_cycles(self) -> None:
+        r"""
+        a requisite cycle, which is found in both the original and the modified graph
+
+           A---* B
+            *    |
+             \   *
+              -- C
+        """
+
+        a = Course("A", 3)
+        b = Course("B", 3)
+        c = Course("C", 3)
+
+        b.add_requisite(a, pre)
+        c.add_requisite(b, pre)
+        a.add_requisite(c, pre)
+
+        curric = Curriculum("Cycle", [a, b, c], sort_by_id=False)
+        errors = StringIO()
+        self.assertFalse(curric.is_valid(errors, max_cycles=1))
+        self.assertEqual(
+            errors.getvalue(), " curriculum 'Cycle' has requisite cycles:\n(A, B, C)\n"
+        )
+        with self.assertRaises(ValueError):
+            curric.is_valid(StringIO(), max_cycles=-1)
+        # the constructor reports a bounded number of cycles when warning
+        output = StringIO()
+        with redirect_stdout(output):
+            Curriculum("Cycle", [a, b, c], sort_by_id=False, warn=True)
+        self.assertEqual(
+            output.getvalue(),
+            "WARNING: Curriculum was created, but is invalid due to requisite cycle(s):\n"
+            " curriculum 'Cycle' has requisite cycles:\n(A, B, C)\n\n",
+        )
+
+    def test_courses_copied(self) -> None:
+        "Changing the caller's course list does not change the curriculum"
+        a = Course("A", 3)
+        b = Course("B", 3)
+        courses: List[AbstractCourse] = [b, a]
+        curric = Curriculum("Copied", courses, sort_by_id=False)
+        courses.append(Course("C", 3))
+        self.assertEqual(curric.courses, [b, a])
+        self.assertEqual(curric.num_courses, 2)
 
     def test_big_unsatisfiable_curric(self):
         curric = read_csv("tests/big_unsatisfiable_curric.csv")
@@ -84,9 +149,8 @@ class CurricularAnalyticsTests(unittest.TestCase):
         read_pipe = StringIO()
         with redirect_stdout(read_pipe):
             self.assertEqual(curric.extraneous_requisites(debug=True), {(a.id, c.id)})
-        read_pipe.seek(0)
         self.assertEqual(
-            read_pipe.read().splitlines(),
+            read_pipe.getvalue().splitlines(),
             [
                 "curriculum Extraneous has extraneous requisites:",
                 "-C has redundant requisite A",
@@ -185,30 +249,20 @@ class CurricularAnalyticsTests(unittest.TestCase):
         )
 
         # Test isvalid_curriculum() and extraneous_requisites()
-        errors = StringIO()
-        self.assertTrue(curric.is_valid(errors))
+        self.assertTrue(curric.is_valid())
         self.assertEqual(len(curric.extraneous_requisites()), 0)
 
-        self.assertEqual(curric.total_delay_factor, 19.0)
-        self.assertEqual(
-            list(map(curric.delay_factor, curric.courses)),
-            [3.0, 3.0, 3.0, 3.0, 3.0, 2.0, 1.0, 1.0],
-        )
-        self.assertEqual(curric.total_blocking_factor, 8)
-        self.assertEqual(
-            list(map(curric.blocking_factor, curric.courses)),
-            [2, 2, 1, 3, 0, 0, 0, 0],
-        )
-        self.assertEqual(curric.total_centrality, 9)
-        self.assertEqual(
-            list(map(curric.centrality, curric.courses)),
-            [0, 0, 9, 0, 0, 0, 0, 0],
-        )
-        self.assertEqual(curric.total_complexity, 27.0)
-        self.assertEqual(
-            list(map(curric.complexity, curric.courses)),
-            [5.0, 5.0, 4.0, 6.0, 3.0, 2.0, 1.0, 1.0],
-        )
+        for metric, total, values in [
+            ("delay_factor", 19.0, [3.0, 3.0, 3.0, 3.0, 3.0, 2.0, 1.0, 1.0]),
+            ("blocking_factor", 8, [2, 2, 1, 3, 0, 0, 0, 0]),
+            ("centrality", 9, [0, 0, 9, 0, 0, 0, 0, 0]),
+            ("complexity", 27.0, [5.0, 5.0, 4.0, 6.0, 3.0, 2.0, 1.0, 1.0]),
+        ]:
+            with self.subTest(metric=metric):
+                self.assertEqual(getattr(curric, f"total_{metric}"), total)
+                self.assertEqual(
+                    list(map(getattr(curric, metric), curric.courses)), values
+                )
 
     def test_7_vertex_test_curriculum(self) -> None:
         """
@@ -248,31 +302,21 @@ class CurricularAnalyticsTests(unittest.TestCase):
         )
 
         # Test isvalid_curriculum() and extraneous_requisites()
-        errors = StringIO()
-        self.assertTrue(curric.is_valid(errors))
+        self.assertTrue(curric.is_valid())
         self.assertEqual(len(curric.extraneous_requisites()), 0)
 
         # Test analytics
-        self.assertEqual(curric.total_delay_factor, 33.0)
-        self.assertEqual(
-            list(map(curric.delay_factor, curric.courses)),
-            [5.0, 5.0, 5.0, 5.0, 3.0, 5.0, 5.0],
-        )
-        self.assertEqual(curric.total_blocking_factor, 16)
-        self.assertEqual(
-            list(map(curric.blocking_factor, curric.courses)),
-            [6, 3, 4, 2, 0, 0, 1],
-        )
-        self.assertEqual(curric.total_centrality, 49)
-        self.assertEqual(
-            list(map(curric.centrality, curric.courses)),
-            [0, 9, 12, 18, 0, 0, 10],
-        )
-        self.assertEqual(curric.total_complexity, 49.0)
-        self.assertEqual(
-            list(map(curric.complexity, curric.courses)),
-            [11.0, 8.0, 9.0, 7.0, 3.0, 5.0, 6.0],
-        )
+        for metric, total, values in [
+            ("delay_factor", 33.0, [5.0, 5.0, 5.0, 5.0, 3.0, 5.0, 5.0]),
+            ("blocking_factor", 16, [6, 3, 4, 2, 0, 0, 1]),
+            ("centrality", 49, [0, 9, 12, 18, 0, 0, 10]),
+            ("complexity", 49.0, [11.0, 8.0, 9.0, 7.0, 3.0, 5.0, 6.0]),
+        ]:
+            with self.subTest(metric=metric):
+                self.assertEqual(getattr(curric, f"total_{metric}"), total)
+                self.assertEqual(
+                    list(map(getattr(curric, metric), curric.courses)), values
+                )
 
     def test_delay_factor_multiple_paths(self) -> None:
         """
@@ -374,26 +418,24 @@ class Test8VertexTestCurriculum(unittest.TestCase):
 
     curric: Curriculum
 
-    def __init__(self, methodName: str = "runTest") -> None:
-        super().__init__(methodName)
-
-        self.C.add_requisite(self.A, pre)
-        self.C.add_requisite(self.B, pre)
-        self.C.add_requisite(self.D, co)
-        self.E.add_requisite(self.C, pre)
-        self.F.add_requisite(self.D, pre)
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.C.add_requisite(cls.A, pre)
+        cls.C.add_requisite(cls.B, pre)
+        cls.C.add_requisite(cls.D, co)
+        cls.E.add_requisite(cls.C, pre)
+        cls.F.add_requisite(cls.D, pre)
 
-        self.curric = Curriculum(
+        cls.curric = Curriculum(
             "Underwater Basket Weaving",
-            [self.A, self.B, self.C, self.D, self.E, self.F, self.G, self.H],
+            [cls.A, cls.B, cls.C, cls.D, cls.E, cls.F, cls.G, cls.H],
             institution="ACME State University",
             cip="445786",
             sort_by_id=False,
         )
 
     def test_isvalid_curriculum(self) -> None:
-        errors = StringIO()
-        self.assertTrue(self.curric.is_valid(errors))
+        self.assertTrue(self.curric.is_valid())
 
     def test_extraneous_requisites(self) -> None:
         self.assertEqual(len(self.curric.extraneous_requisites()), 0)
@@ -401,26 +443,18 @@ class Test8VertexTestCurriculum(unittest.TestCase):
     def test_basic_metrics(self) -> None:
         self.assertEqual(self.curric.credit_hours, 22)
         self.assertEqual(self.curric.num_courses, 8)
-        self.assertEqual(self.curric.total_blocking_factor, 8)
-        self.assertEqual(
-            list(map(self.curric.blocking_factor, self.curric.courses)),
-            [2, 2, 1, 3, 0, 0, 0, 0],
-        )
-        self.assertEqual(self.curric.total_delay_factor, 19.0)
-        self.assertEqual(
-            list(map(self.curric.delay_factor, self.curric.courses)),
-            [3.0, 3.0, 3.0, 3.0, 3.0, 2.0, 1.0, 1.0],
-        )
-        self.assertEqual(self.curric.total_centrality, 9)
-        self.assertEqual(
-            list(map(self.curric.centrality, self.curric.courses)),
-            [0, 0, 9, 0, 0, 0, 0, 0],
-        )
-        self.assertEqual(self.curric.total_complexity, 27.0)
-        self.assertEqual(
-            list(map(self.curric.complexity, self.curric.courses)),
-            [5.0, 5.0, 4.0, 6.0, 3.0, 2.0, 1.0, 1.0],
-        )
+        for metric, total, values in [
+            ("blocking_factor", 8, [2, 2, 1, 3, 0, 0, 0, 0]),
+            ("delay_factor", 19.0, [3.0, 3.0, 3.0, 3.0, 3.0, 2.0, 1.0, 1.0]),
+            ("centrality", 9, [0, 0, 9, 0, 0, 0, 0, 0]),
+            ("complexity", 27.0, [5.0, 5.0, 4.0, 6.0, 3.0, 2.0, 1.0, 1.0]),
+        ]:
+            with self.subTest(metric=metric):
+                self.assertEqual(getattr(self.curric, f"total_{metric}"), total)
+                self.assertEqual(
+                    list(map(getattr(self.curric, metric), self.curric.courses)),
+                    values,
+                )
         self.assertEqual(self.curric.basic_metrics.max_blocking_factor, 3)
         self.assertEqual(len(self.curric.basic_metrics.max_blocking_factor_courses), 1)
         self.assertEqual(
@@ -1,11 +1,15 @@
 import os
+import tempfile
 import unittest
 from pathlib import Path
+from typing import Dict, List, NamedTuple, cast
 
 from curricularanalytics import (
+    AbstractCourse,
     Course,
     Curriculum,
     DegreePlan,
+    Requisite,
     Term,
     co,
     pre,
@@ -16,10 +20,102 @@ from curricularanalytics import (
 )
 
 
+class ExpectedCourse(NamedTuple):
+    "The attributes of a course that the data file tests check."
+
+    name: str
+    credit_hours: float
+    prefix: str
+    num: str
+    canonical_name: str
+    requisites: Dict[int, Requisite]
+
+
+def course_attributes(course: AbstractCourse) -> ExpectedCourse:
+    "Project a course onto the attributes listed in the expected-course tables."
+    # the tests check that every parsed course is a Course before projecting them
+    course = cast(Course, course)
+    return ExpectedCourse(
+        course.name,
+        course.credit_hours,
+        course.prefix,
+        course.num,
+        course.canonical_name,
+        course.requisites,
+    )
+
+
+# the expected attributes of each course in curriculum.csv, by course ID
+EXPECTED_COURSES: Dict[int, ExpectedCourse] = {
+    1: ExpectedCourse("Introduction to Baskets", 3, "BW", "110", "Baskets I", {}),
+    2: ExpectedCourse("Swimming", 3, "PE", "115", "Physical Education", {}),
+    3: ExpectedCourse(
+        "Introductory Calculus w/ Basketry Applications",
+        4,
+        "MA",
+        "116",
+        "Calculus I",
+        {},
+    ),
+    4: ExpectedCourse(
+        "Basic Basket Forms", 3, "BW", "111", "Baskets II", {1: pre, 5: strict_co}
+    ),
+    5: ExpectedCourse(
+        "Basic Basket Forms Lab", 1, "BW", "111L", "Baskets II Laboratory", {}
+    ),
+    6: ExpectedCourse(
+        "Advanced Basketry", 3, "BW", "201", "Baskets III", {4: pre, 5: pre, 3: co}
+    ),
+    7: ExpectedCourse(
+        "Basket Materials & Decoration", 3, "BW", "214", "Basket Materials", {1: pre}
+    ),
+    8: ExpectedCourse(
+        "Underwater Weaving", 3, "BW", "301", "Baskets IV", {2: pre, 7: co}
+    ),
+    9: ExpectedCourse("Humanitites Elective", 3, "", "", "Humanitites Core", {}),
+    10: ExpectedCourse("Social Sciences Elective", 3, "", "", "", {}),
+    11: ExpectedCourse("Technical Elective", 3, "", "", "", {}),
+    12: ExpectedCourse("General Elective", 3, "", "", "", {}),
+}
+
+# the expected attributes of the additional courses in degree_plan.csv, by course ID
+EXPECTED_ADDITIONAL_COURSES: Dict[int, ExpectedCourse] = {
+    13: ExpectedCourse(
+        "Precalculus w/ Basketry Applications", 3, "MA", "110", "Precalculus", {14: pre}
+    ),
+    14: ExpectedCourse(
+        "College Algebra", 3, "MA", "102", "College Algebra", {15: strict_co}
+    ),
+    15: ExpectedCourse(
+        "College Algebra Studio", 1, "MA", "102S", "College Algebra Recitation", {}
+    ),
+    16: ExpectedCourse(
+        "Hemp Baskets", 3, "BW", "420", "College Algebra Recitation", {6: co}
+    ),
+}
+
+
 class DataHandlerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # parse each data file once for the whole class
+        cls.curric = read_csv("./tests/curriculum.csv")
+        cls.dp = read_csv("./tests/degree_plan.csv")
+
+    def _check_courses(
+        self, courses: List[AbstractCourse], expected: Dict[int, ExpectedCourse]
+    ) -> None:
+        "Check parsed courses against an expected-course table keyed by course ID."
+        self.assertTrue(all(isinstance(course, Course) for course in courses))
+        for course in courses:
+            self.assertEqual(course.institution, "ACME State University")
+        self.assertEqual(
+            {course.id: course_attributes(course) for course in courses}, expected
+        )
+
     def test_curriclum_data_format(self) -> None:
         "test the data file format used for curricula"
-        curric = read_csv("./tests/curriculum.csv")
+        curric = self.curric
         self.assertFalse(Path("./tests/curriculum_temp.csv").exists())
         self.assertIsInstance(curric, Curriculum)
         assert isinstance(curric, Curriculum)
@@ -33,118 +129,12 @@ class DataHandlerTests(unittest.TestCase):
         self.assertEqual(curric.num_courses, 12)
         self.assertEqual(curric.credit_hours, 35)
         # test courses
-        for course in curric.courses:
-            if course.id == 1:
-                self.assertEqual(course.name, "Introduction to Baskets")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "110")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Baskets I")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 2:
-                self.assertEqual(course.name, "Swimming")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "PE")
-                self.assertEqual(course.num, "115")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Physical Education")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 3:
-                self.assertEqual(
-                    course.name, "Introductory Calculus w/ Basketry Applications"
-                )
-                self.assertEqual(course.credit_hours, 4)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "MA")
-                self.assertEqual(course.num, "116")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Calculus I")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 4:
-                self.assertEqual(course.name, "Basic Basket Forms")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "111")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Baskets II")
-                self.assertEqual(course.requisites[1], pre)
-                self.assertEqual(course.requisites[5], strict_co)
-            elif course.id == 5:
-                self.assertEqual(course.name, "Basic Basket Forms Lab")
-                self.assertEqual(course.credit_hours, 1)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "111L")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Baskets II Laboratory")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 6:
-                self.assertEqual(course.name, "Advanced Basketry")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "201")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Baskets III")
-                self.assertEqual(course.requisites[4], pre)
-                self.assertEqual(course.requisites[5], pre)
-                self.assertEqual(course.requisites[3], co)
-            elif course.id == 7:
-                self.assertEqual(course.name, "Basket Materials & Decoration")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "214")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Basket Materials")
-                self.assertEqual(course.requisites[1], pre)
-            elif course.id == 8:
-                self.assertEqual(course.name, "Underwater Weaving")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "301")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Baskets IV")
-                self.assertEqual(course.requisites[2], pre)
-                self.assertEqual(course.requisites[7], co)
-            elif course.id == 9:
-                self.assertEqual(course.name, "Humanitites Elective")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 10:
-                self.assertEqual(course.name, "Social Sciences Elective")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 11:
-                self.assertEqual(course.name, "Technical Elective")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 12:
-                self.assertEqual(course.name, "General Elective")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(len(course.requisites), 0)
+        self._check_courses(curric.courses, EXPECTED_COURSES)
         # TODO: add learning outcomes
 
     def test_degree_plan_data_format(self) -> None:
         "test the data file format used for degree plans"
-        dp = read_csv("./tests/degree_plan.csv")
+        dp = self.dp
         self.assertFalse(Path("./tests/degree_plan_temp.csv").exists())
         self.assertIsInstance(dp, DegreePlan)
         assert isinstance(dp, DegreePlan)
@@ -162,166 +152,15 @@ class DataHandlerTests(unittest.TestCase):
         # test courses -- same tests as in the above curriculum, but a few additional courses
         # have been added, as well as a new requisite to an existing courses.
         # test courses
-        curric = dp.curriculum
-        for course in curric.courses:
-            if course.id == 1:
-                self.assertEqual(course.name, "Introduction to Baskets")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "110")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Baskets I")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 2:
-                self.assertEqual(course.name, "Swimming")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "PE")
-                self.assertEqual(course.num, "115")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Physical Education")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 3:
-                self.assertEqual(
-                    course.name, "Introductory Calculus w/ Basketry Applications"
-                )
-                self.assertEqual(course.credit_hours, 4)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "MA")
-                self.assertEqual(course.num, "116")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Calculus I")
-                # this is the only difference from above tests
-                self.assertEqual(course.requisites[13], pre)
-            elif course.id == 4:
-                self.assertEqual(course.name, "Basic Basket Forms")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "111")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Baskets II")
-                self.assertEqual(course.requisites[1], pre)
-                self.assertEqual(course.requisites[5], strict_co)
-            elif course.id == 5:
-                self.assertEqual(course.name, "Basic Basket Forms Lab")
-                self.assertEqual(course.credit_hours, 1)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "111L")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Baskets II Laboratory")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 6:
-                self.assertEqual(course.name, "Advanced Basketry")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "201")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Baskets III")
-                self.assertEqual(course.requisites[4], pre)
-                self.assertEqual(course.requisites[5], pre)
-                self.assertEqual(course.requisites[3], co)
-            elif course.id == 7:
-                self.assertEqual(course.name, "Basket Materials & Decoration")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "214")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Basket Materials")
-                self.assertEqual(course.requisites[1], pre)
-            elif course.id == 8:
-                self.assertEqual(course.name, "Underwater Weaving")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "301")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Baskets IV")
-                self.assertEqual(course.requisites[2], pre)
-                self.assertEqual(course.requisites[7], co)
-            elif course.id == 9:
-                self.assertEqual(course.name, "Humanitites Elective")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 10:
-                self.assertEqual(course.name, "Social Sciences Elective")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 11:
-                self.assertEqual(course.name, "Technical Elective")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 12:
-                self.assertEqual(course.name, "General Elective")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(len(course.requisites), 0)
+        expected_courses = {
+            **EXPECTED_COURSES,
+            # this is the only difference from above tests
+            3: EXPECTED_COURSES[3]._replace(requisites={13: pre}),
+            **EXPECTED_ADDITIONAL_COURSES,
+        }
+        self._check_courses(dp.curriculum.courses, expected_courses)
         # test additional courses
-        for course in dp.additional_courses:
-            if course.id == 13:
-                self.assertEqual(
-                    course.name,
-                    "Precalculus w/ Basketry Applications",
-                )
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "MA")
-                self.assertEqual(course.num, "110")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "Precalculus")
-                self.assertEqual(course.requisites[14], pre)
-            elif course.id == 14:
-                self.assertEqual(course.name, "College Algebra")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "MA")
-                self.assertEqual(course.num, "102")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(course.canonical_name, "College Algebra")
-                self.assertEqual(course.requisites[15], strict_co)
-            elif course.id == 15:
-                self.assertEqual(course.name, "College Algebra Studio")
-                self.assertEqual(course.credit_hours, 1)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "MA")
-                self.assertEqual(course.num, "102S")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(
-                    course.canonical_name,
-                    "College Algebra Recitation",
-                )
-                self.assertEqual(len(course.requisites), 0)
-            elif course.id == 16:
-                self.assertEqual(course.name, "Hemp Baskets")
-                self.assertEqual(course.credit_hours, 3)
-                self.assertIsInstance(course, Course)
-                assert isinstance(course, Course)
-                self.assertEqual(course.prefix, "BW")
-                self.assertEqual(course.num, "420")
-                self.assertEqual(course.institution, "ACME State University")
-                self.assertEqual(
-                    course.canonical_name,
-                    "College Algebra Recitation",
-                )
-                self.assertEqual(course.requisites[6], co)
+        self._check_courses(dp.additional_courses, EXPECTED_ADDITIONAL_COURSES)
         # TODO: add learning outcomes
 
     def test_read_write_invariance(self) -> None:
@@ -337,74 +176,80 @@ class DataHandlerTests(unittest.TestCase):
            (A,C) - pre;  (C,E) -  pre; (B,C) - pre; (D,C) - co; (C,E) - pre; (D,F) - pre
         """
 
-        try:
-            A = Course(
-                "Introduction to Baskets",
-                3.0,
-                institution="ACME State University",
-                prefix="BW",
-                num="101",
-                canonical_name="Baskets I",
-            )
-            B = Course(
-                "Swimming",
-                3.0,
-                institution="ACME State University",
-                prefix="PE",
-                num="115",
-                canonical_name="Physical Education",
-            )
-            C = Course(
-                "Basic Basket Forms",
-                3.0,
-                institution="ACME State University",
-                prefix="BW",
-                num="111",
-                canonical_name="Baskets I",
-            )
-            D = Course(
-                "Basic Basket Forms Lab",
-                1.0,
-                institution="ACME State University",
-                prefix="BW",
-                num="111L",
-                canonical_name="Baskets I Laboratory",
-            )
-            E = Course(
-                "Advanced Basketry",
-                3.0,
-                institution="ACME State University",
-                prefix="CS",
-                num="300",
-                canonical_name="Baskets II",
-            )
-            F = Course(
-                "Basket Materials & Decoration",
-                3.0,
-                institution="ACME State University",
-                prefix="BW",
-                num="214",
-                canonical_name="Basket Materials",
-            )
+        A = Course(
+            "Introduction to Baskets",
+            3.0,
+            institution="ACME State University",
+            prefix="BW",
+            num="101",
+            canonical_name="Baskets I",
+        )
+        B = Course(
+            "Swimming",
+            3.0,
+            institution="ACME State University",
+            prefix="PE",
+            num="115",
+            canonical_name="Physical Education",
+        )
+        C = Course(
+            "Basic Basket Forms",
+            3.0,
+            institution="ACME State University",
+            prefix="BW",
+            num="111",
+            canonical_name="Baskets I",
+        )
+        D = Course(
+            "Basic Basket Forms Lab",
+            1.0,
+            institution="ACME State University",
+            prefix="BW",
+            num="111L",
+            canonical_name="Baskets I Laboratory",
+        )
+        E = Course(
+            "Advanced Basketry",
+            3.0,
+            institution="ACME State University",
+            prefix="CS",
+            num="300",
+            canonical_name="Baskets II",
+        )
+        F = Course(
+            "Basket Materials & Decoration",
+            3.0,
+            institution="ACME State University",
+            prefix="BW",
+            num="214",
+            canonical_name="Basket Materials",
+        )
+
+        C.add_requisite(A, pre)
+        C.add_requisite(B, pre)
+        C.add_requisite(D, co)
+        E.add_requisite(C, pre)
+        F.add_requisite(D, pre)
 
-            C.add_requisite(A, pre)
-            C.add_requisite(B, pre)
-            C.add_requisite(D, co)
-            E.add_requisite(C, pre)
-            F.add_requisite(D, pre)
+        curric1 = Curriculum(
+            "Underwater Basket Weaving",
+            [A, B, C, D, E, F],
+            institution="ACME State University",
+            cip="445786",
+        )
 
-            curric1 = Curriculum(
-                "Underwater Basket Weaving",
-                [A, B, C, D, E, F],
-                institution="ACME State University",
-                cip="445786",
-            )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            curric_path = os.path.join(temp_dir, "UBW-curric.csv")
+            dp_path = os.path.join(temp_dir, "UBW-degree-plan.csv")
             # write curriculum to secondary storage
-            self.assertIsNone(write_csv(curric1, "./tests/UBW-curric.csv"))
+            self.assertIsNone(write_csv(curric1, curric_path))
             # read from same location
-            curric2 = read_csv("./tests/UBW-curric.csv")
-            self.assertFalse(Path("./tests/UBW-curric_temp.csv").exists())
-            self.assertEqual(str(curric1), str(curric2))  # read/write invariance test
+            curric2 = read_csv(curric_path)
+            self.assertFalse(Path(temp_dir, "UBW-curric_temp.csv").exists())
+            self.assertIsInstance(curric2, Curriculum)
+            assert isinstance(curric2, Curriculum)
+            # read/write invariance test
+            self.assertEqual(curric1.describe(), curric2.describe())
 
             terms = [
                 Term([A, B]),
@@ -414,15 +259,12 @@ class DataHandlerTests(unittest.TestCase):
 
             dp1 = DegreePlan("3-term UBW plan", curric1, terms)
             # write degree plan to secondary storage
-            self.assertIsNone(write_csv(dp1, "./tests/UBW-degree-plan.csv"))
+            self.assertIsNone(write_csv(dp1, dp_path))
             # read from same location
-            dp2 = read_csv("./tests/UBW-degree-plan.csv")
-            self.assertFalse(Path("./tests/UBW-degree-plan_temp.csv").exists())
+            dp2 = read_csv(dp_path)
+            self.assertFalse(Path(temp_dir, "UBW-degree-plan_temp.csv").exists())
 
+            self.assertIsInstance(dp2, DegreePlan)
+            assert isinstance(dp2, DegreePlan)
             self.assertEqual(str(dp1), str(dp2))  # read/write invariance test
-        finally:
-            try:
-                os.remove("./tests/UBW-curric.csv")
-                os.remove("./tests/UBW-degree-plan.csv")
-            except FileNotFoundError:
-                pass
+            self.assertEqual(dp1.curriculum.describe(), dp2.curriculum.describe())
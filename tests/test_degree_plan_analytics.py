@@ -1,101 +1,109 @@
 import unittest
 from contextlib import redirect_stdout
 from io import StringIO
+from typing import List
 
 from curricularanalytics import Course, Curriculum, DegreePlan, Term, co, pre, strict_co
 
-r"""
-6-vertex test curriculum - valid
 
-    /---------------------*\
-A --------* C    /-----* E
-            /-----/      */|*
-            /  |----------/ |
-B-------/   D            F
-    \---------------------*/
+class DegreePlanAnalyticsTests(unittest.TestCase):
+    r"""
+    6-vertex test curriculum - valid
 
-(A,C) - pre;  (A,E) -  pre; (B,E) - pre; (B,F) - pre; (D,E) - co; (F,E) - strict_co
-"""
+        /---------------------*\
+    A --------* C    /-----* E
+                /-----/      */|*
+                /  |----------/ |
+    B-------/   D            F
+        \---------------------*/
 
-A = Course("A", 3)
-B = Course("B", 1)
-C = Course("C", 2)
-D = Course("D", 1)
-E = Course("E", 4)
-F = Course("F", 1)
+    (A,C) - pre;  (A,E) -  pre; (B,E) - pre; (B,F) - pre; (D,E) - co; (F,E) - strict_co
+    """
 
-E.add_requisite(A, pre)
-C.add_requisite(A, pre)
-E.add_requisite(B, pre)
-F.add_requisite(B, pre)
-E.add_requisite(D, co)
-E.add_requisite(F, strict_co)
+    A: Course
+    B: Course
+    C: Course
+    D: Course
+    E: Course
+    F: Course
+    curric: Curriculum
+    terms: List[Term]
+    dp: DegreePlan
 
-curric = Curriculum("Test Curric", [A, B, C, D, E, F])
-terms = [Term([A, B]), Term([C, D]), Term([E, F])]
-dp = DegreePlan("Test Plan", curric, terms)
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.A = Course("A", 3)
+        cls.B = Course("B", 1)
+        cls.C = Course("C", 2)
+        cls.D = Course("D", 1)
+        cls.E = Course("E", 4)
+        cls.F = Course("F", 1)
 
+        cls.E.add_requisite(cls.A, pre)
+        cls.C.add_requisite(cls.A, pre)
+        cls.E.add_requisite(cls.B, pre)
+        cls.F.add_requisite(cls.B, pre)
+        cls.E.add_requisite(cls.D, co)
+        cls.E.add_requisite(cls.F, strict_co)
+
+        cls.curric = Curriculum(
+            "Test Curric", [cls.A, cls.B, cls.C, cls.D, cls.E, cls.F]
+        )
+        cls.terms = [Term([cls.A, cls.B]), Term([cls.C, cls.D]), Term([cls.E, cls.F])]
+        cls.dp = DegreePlan("Test Plan", cls.curric, cls.terms)
 
-class DegreePlanAnalyticsTests(unittest.TestCase):
     def test_isvalid(self) -> None:
-        self.assertTrue(dp.is_valid())
-        dp_bad1 = DegreePlan(
-            "Bad Plan 1", curric, [terms[0], terms[1]]
-        )  # missing some courses
-        self.assertFalse(dp_bad1.is_valid())
-        dp_bad2 = DegreePlan(
-            "Bad Plan 2", curric, [terms[1], terms[0], terms[2]]
-        )  # out of order requisites
-        self.assertFalse(dp_bad2.is_valid())
+        self.assertTrue(self.dp.is_valid())
+        for name, terms in [
+            # missing some courses
+            ("Bad Plan 1", [self.terms[0], self.terms[1]]),
+            # out of order requisites
+            ("Bad Plan 2", [self.terms[1], self.terms[0], self.terms[2]]),
+        ]:
+            with self.subTest(name=name):
+                self.assertFalse(DegreePlan(name, self.curric, terms).is_valid())
 
-        self.assertEqual(dp.find_term(F), 2)
+        self.assertEqual(self.dp.find_term(self.F), 2)
 
     def test_print_plan(self) -> None:
         "Test the output of print_plan()"
         read_pipe = StringIO()
         with redirect_stdout(read_pipe):
-            dp.print()
-        read_pipe.seek(0)
-        self.assertEqual(
-            read_pipe.read().splitlines()[0:17],
-            [
-                "",
-                "Degree Plan: Test Plan for BS in Test Curric",
-                "",
-                " 12 credit hours",
-                " Term 1 courses:",
-                " A ",
-                " B ",
-                "",
-                "",
-                " Term 2 courses:",
-                " C ",
-                " D ",
-                "",
-                "",
-                " Term 3 courses:",
-                " E ",
-                " F ",
-            ],
+            self.dp.print()
+        self.assertMultiLineEqual(
+            read_pipe.getvalue(),
+            "\nDegree Plan: Test Plan for BS in Test Curric\n\n"
+            " 12 credit hours\n"
+            " Term 1 courses:\n A \n B \n\n\n"
+            " Term 2 courses:\n C \n D \n\n\n"
+            " Term 3 courses:\n E \n F \n\n\n",
+        )
+
+    def test_knowledge_transfer(self) -> None:
+        "Test knowledge_transfer(plan)"
+        self.assertEqual(self.dp.knowledge_transfer(), [4, 4])
+        dp_partial = DegreePlan(
+            "Partial Plan", self.curric, [self.terms[0], self.terms[1]]
         )
+        self.assertEqual(dp_partial.knowledge_transfer(), [4])
 
     def test_requisite_distance(self) -> None:
         "Test requisite_distance(plan, course) and requisite_distance(plan)"
-        self.assertEqual(dp.requisite_distance(A), 0)
-        self.assertEqual(dp.requisite_distance(B), 0)
-        self.assertEqual(dp.requisite_distance(C), 1)
-        self.assertEqual(dp.requisite_distance(D), 0)
-        self.assertEqual(dp.requisite_distance(E), 5)
-        self.assertEqual(dp.requisite_distance(F), 2)
-        self.assertEqual(dp.total_requisite_distance, 8)
+        self.assertEqual(self.dp.requisite_distance(self.A), 0)
+        self.assertEqual(self.dp.requisite_distance(self.B), 0)
+        self.assertEqual(self.dp.requisite_distance(self.C), 1)
+        self.assertEqual(self.dp.requisite_distance(self.D), 0)
+        self.assertEqual(self.dp.requisite_distance(self.E), 5)
+        self.assertEqual(self.dp.requisite_distance(self.F), 2)
+        self.assertEqual(self.dp.total_requisite_distance, 8)
 
     def test_basic_metrics(self) -> None:
         "Test basic basic_metrics(plan)"
-        self.assertEqual(dp.credit_hours, 12)
-        self.assertEqual(dp.basic_metrics.average, 4.0)
-        self.assertEqual(dp.basic_metrics.min, 3)
-        self.assertEqual(dp.basic_metrics.max, 5)
-        self.assertAlmostEqual(dp.basic_metrics.stddev, 0.816497, places=5)
-        self.assertEqual(dp.num_terms, 3)
-        self.assertEqual(dp.basic_metrics.min_term + 1, 2)
-        self.assertEqual(dp.basic_metrics.max_term + 1, 3)
+        self.assertEqual(self.dp.credit_hours, 12)
+        self.assertEqual(self.dp.basic_metrics.average, 4.0)
+        self.assertEqual(self.dp.basic_metrics.min, 3)
+        self.assertEqual(self.dp.basic_metrics.max, 5)
+        self.assertAlmostEqual(self.dp.basic_metrics.stddev, 0.816497, places=5)
+        self.assertEqual(self.dp.num_terms, 3)
+        self.assertEqual(self.dp.basic_metrics.min_term + 1, 2)
+        self.assertEqual(self.dp.basic_metrics.max_term + 1, 3)
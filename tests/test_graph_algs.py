@@ -82,6 +82,8 @@ class GraphAlgsTests(unittest.TestCase):
     def test_reachable_from(self) -> None:
         "test reachable_from()"
         self.assertEqual(sorted(reachable_from(self.g, 2)), [3, 5, 6, 10])
+        # vertices already in the list still have their descendants visited
+        self.assertEqual(sorted(reachable_from(self.g, 2, [6])), [3, 5, 6, 10])
 
     def test_reachable_from_subgraph(self) -> None:
         "test reachable_from_subgraph()"
@@ -126,3 +128,10 @@ class GraphAlgsTests(unittest.TestCase):
         "test longest path algorithms"
         self.assertEqual(longest_path(self.g, 2), [2, 6, 10])
         self.assertEqual(longest_paths(self.g), [[4, 2, 6, 10]])
+        self.assertEqual(longest_paths(self.g, all_paths(self.g)), [[4, 2, 6, 10]])
+        self.assertEqual(longest_paths(self.g, []), [[4, 2, 6, 10]])
+        cycle: "nx.DiGraph[int]" = nx.DiGraph()
+        cycle.add_edge(0, 1)
+        cycle.add_edge(1, 0)
+        with self.assertRaises(nx.NetworkXUnfeasible):
+            longest_paths(cycle)
@@ -4,12 +4,14 @@ from typing import (
     Generic,
     Hashable,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
     Set,
     Tuple,
     TypeVar,
+    overload,
 )
 
 Node = TypeVar("Node", bound=Hashable)
@@ -27,12 +29,23 @@ class InEdgeView(OutEdgeView[Node]):
 
 class Graph(Generic[Node]):
     nodes: NodeView[Node]
+    edges: OutEdgeView[Node]
     def add_nodes_from(
         self, nodes_for_adding: Iterable[Node], **attr: Dict[Hashable, Any]
     ) -> None: ...
     def add_edge(
         self, u_of_edge: Node, v_of_edge: Node, **attr: Dict[Hashable, Any]
     ) -> None: ...
+    @overload
+    def add_edges_from(
+        self, ebunch_to_add: Iterable[Edge[Node]], **attr: Dict[Hashable, Any]
+    ) -> None: ...
+    @overload
+    def add_edges_from(
+        self,
+        ebunch_to_add: Iterable[Tuple[Node, Node, Dict[Hashable, Any]]],
+        **attr: Dict[Hashable, Any],
+    ) -> None: ...
     def has_edge(self, u: Node, v: Node) -> bool: ...
     def neighbors(self, n: Node) -> Iterable[Node]: ...
     def number_of_nodes(self) -> int: ...
@@ -46,6 +59,8 @@ class DiGraph(Graph[Node]):
     def in_edges(self, nbunch: Node) -> InEdgeView[Node]: ...
     def in_degree(self, nbunch: Node) -> int: ...
     def out_degree(self, nbunch: Node) -> int: ...
+    def predecessors(self, n: Node) -> Iterator[Node]: ...
+    def successors(self, n: Node) -> Iterator[Node]: ...
     def reverse(self) -> DiGraph[Node]: ...
 
 def set_edge_attributes(
@@ -54,10 +69,18 @@ def set_edge_attributes(
 ) -> None: ...
 def has_path(G: Graph[Node], source: Hashable, target: Hashable) -> bool: ...
 def simple_cycles(G: Graph[Node]) -> Iterable[List[Node]]: ...
+def topological_sort(G: DiGraph[Node]) -> Iterator[Node]: ...
+def is_directed_acyclic_graph(G: Graph[Node]) -> bool: ...
+def transitive_reduction(G: DiGraph[Node]) -> DiGraph[Node]: ...
 def find_cycle(G: Graph[Node], source: Optional[Node] = None) -> List[Edge[Node]]: ...
 def weakly_connected_components(G: DiGraph[Node]) -> Iterable[Set[Node]]: ...
+def strongly_connected_components(G: DiGraph[Node]) -> Iterator[Set[Node]]: ...
 def shortest_path(G: Graph[Node], s: Node) -> Dict[Node, List[Node]]: ...
 
 class NetworkXNoCycle(Exception):
     """Exception for algorithms that should return a cycle when running
     on graphs where such a cycle does not exist."""
+
+class NetworkXUnfeasible(Exception):
+    """Exception raised by algorithms trying to solve a problem
+    instance that has no feasible solution."""